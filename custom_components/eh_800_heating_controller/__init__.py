@@ -14,23 +14,55 @@ import aiohttp
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.typing import ConfigType
 
     from .data import EH800ConfigEntry
 
-from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.loader import async_get_loaded_integration
-
 from .api import OumanEH800ApiClient
-from .const import CONF_IP, SENSOR_DESCRIPTIONS
-from .coordinator import EH800Coordinator
+from .capture import CaptureWriter
+from .const import (
+    CONF_ALARM_INTERVAL,
+    CONF_EXTRA_REGISTERS,
+    CONF_IP,
+    CONF_RECORD_TRAFFIC,
+    CONF_TREND_IMPORT,
+    DEFAULT_ALARM_INTERVAL,
+    DOMAIN,
+)
 from .data import EH800Data
-
-PLATFORMS: list[Platform] = [
-    Platform.SENSOR,
-]
+from .registers import REGISTERS
+
+try:
+    from homeassistant.const import CONF_PASSWORD, CONF_USERNAME, Platform
+    from homeassistant.helpers import config_validation as cv
+    from homeassistant.loader import async_get_loaded_integration
+
+    from .alarm import EH800AlarmCoordinator
+    from .coordinator import EH800Coordinator
+    from .services import async_setup_services
+    from .store import async_load_registers, async_remove_stores
+    from .trend import async_import_trend
+except ModuleNotFoundError as exc:
+    # Running headless without Home Assistant, see __main__.py. Any other
+    # missing module is a real error.
+    if exc.name is None or exc.name.partition(".")[0] != "homeassistant":
+        raise
+    PLATFORMS = []
+else:
+    PLATFORMS: list[Platform] = [
+        Platform.BINARY_SENSOR,
+        Platform.SENSOR,
+    ]
+    CONFIG_SCHEMA = cv.config_entry_only_config_schema(DOMAIN)
 _LOGGER = logging.getLogger(__name__)
 
 
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:  # noqa: ARG001
+    """Set up the services of the integration."""
+    async_setup_services(hass)
+    return True
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: EH800ConfigEntry,
@@ -43,8 +75,28 @@ async def async_setup_entry(
     session = aiohttp.ClientSession(
         connector=connector, timeout=aiohttp.ClientTimeout(total=120)
     )
+    # Also runs when setup fails and is retried, so the session never leaks
+    entry.async_on_unload(session.close)
     # Build a list of keys that we actually want to expose
-    keys = list(SENSOR_DESCRIPTIONS.keys())
+    keys = list(REGISTERS.keys)
+    # Registers found by the discover_registers service and enabled by the user
+    registers = await async_load_registers(hass, entry.entry_id)
+    keys += [
+        key
+        for key in entry.data.get(CONF_EXTRA_REGISTERS, [])
+        if key in registers and key not in REGISTERS
+    ]
+    # Record the raw traffic for offline profiling when asked to
+    capture = None
+    if entry.data.get(CONF_RECORD_TRAFFIC, False):
+        capture = CaptureWriter(hass.config.path(f"{DOMAIN}.{entry.entry_id}.jsonl.gz"))
+        _LOGGER.info("Recording EH800 traffic to %s", capture.path)
+
+        async def _async_close_capture() -> None:
+            """Finish the gzip stream of the capture."""
+            await hass.async_add_executor_job(capture.close)
+
+        entry.async_on_unload(_async_close_capture)
     # Create the API client
     client = OumanEH800ApiClient(
         hass=hass,
@@ -52,20 +104,44 @@ async def async_setup_entry(
         username=entry.data[CONF_USERNAME],
         password=entry.data[CONF_PASSWORD],
         session=session,
+        capture=capture,
     )
 
     coordinator = EH800Coordinator(hass, client, keys, entry, session=session)
+    # Alarm channel reading only the fast tier on its own short interval
+    alarm = None
+    alarm_interval = int(entry.data.get(CONF_ALARM_INTERVAL, DEFAULT_ALARM_INTERVAL))
+    if alarm_interval > 0:
+        alarm = EH800AlarmCoordinator(hass, coordinator, entry, alarm_interval)
     # Store data for this config entry
     entry.runtime_data = EH800Data(
         client=client,
         integration=async_get_loaded_integration(hass, entry.domain),
         coordinator=coordinator,
+        registers=registers,
+        alarm=alarm,
     )
 
     await coordinator.async_config_entry_first_refresh()
+    if alarm is not None:
+        # The limits come from the first full sweep, so the alarm channel
+        # starts after it. A failed read leaves it unavailable until its next
+        # check, setup only depends on the full sweep. Keep it polling for the
+        # events even when the alarm sensor is disabled.
+        await alarm.async_refresh()
+        entry.async_on_unload(alarm.async_add_listener(lambda: None))
 
     # Register all the sensors
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # Fill statistics gaps from a restart or an outage from the device trend log.
+    # Opt-in, the trend endpoint is not confirmed on every firmware.
+    if (
+        entry.data.get(CONF_TREND_IMPORT, False)
+        and "recorder" in hass.config.components
+    ):
+        entry.async_create_background_task(
+            hass, async_import_trend(hass, entry), f"{DOMAIN} trend import"
+        )
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
     return True
@@ -85,3 +161,11 @@ async def async_reload_entry(
 ) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(entry.entry_id)
+
+
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: EH800ConfigEntry,
+) -> None:
+    """Remove the stored data of an entry."""
+    await async_remove_stores(hass, entry.entry_id)
@@ -0,0 +1,244 @@
+"""
+Poll EH-800 controllers without Home Assistant.
+
+Usage:
+    python -m eh_800_heating_controller --host 192.168.1.55 --format prometheus
+
+Run with `custom_components` on PYTHONPATH. Readings are streamed as JSON
+lines or CSV to stdout (or --output), or served as a Prometheus endpoint.
+Raw traffic can be recorded with --record and played back with --replay.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import json
+import logging
+import os
+import sys
+import time
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+import aiohttp
+
+from .api import OumanEH800ApiClient, OumanEH800ApiClientError
+from .capture import CaptureExhaustedError, CaptureWriter, ReplaySession
+from .const import DEFAULT_IP
+from .discovery import async_scan_registers, register_range
+from .exporters import CsvExporter, JsonLinesExporter, PrometheusExporter
+from .registers import REGISTERS, build_batches
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from .exporters import EH800Exporter
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _parse_args(argv: list[str] | None = None) -> argparse.Namespace:
+    """Parse the command line."""
+    parser = argparse.ArgumentParser(
+        prog="python -m eh_800_heating_controller",
+        description="Poll EH-800 heating controllers and export the readings.",
+    )
+    parser.add_argument(
+        "--host",
+        action="append",
+        help=f"controller IP address, may be repeated (default {DEFAULT_IP})",
+    )
+    parser.add_argument(
+        "--username", default=os.environ.get("EH800_USERNAME", ""), help="username"
+    )
+    parser.add_argument(
+        "--password",
+        default=os.environ.get("EH800_PASSWORD", ""),
+        help="password (default from EH800_PASSWORD)",
+    )
+    parser.add_argument(
+        "--key",
+        action="append",
+        dest="keys",
+        help="register to read, may be repeated (default all known registers)",
+    )
+    parser.add_argument(
+        "--interval", type=float, default=60, help="seconds between sweeps"
+    )
+    parser.add_argument(
+        "--count", type=int, default=0, help="number of sweeps, 0 runs forever"
+    )
+    parser.add_argument(
+        "--format", choices=("jsonl", "csv", "prometheus"), default="jsonl"
+    )
+    parser.add_argument("--output", help="file to append to (default stdout)")
+    parser.add_argument(
+        "--listen",
+        default="0.0.0.0:9800",
+        help="address of the Prometheus endpoint",
+    )
+    parser.add_argument(
+        "--discover",
+        metavar="FIRST-LAST",
+        help="scan registers S_FIRST_85..S_LAST_85 instead of polling",
+    )
+    parser.add_argument(
+        "--rate", type=float, default=2.0, help="discovery requests per second"
+    )
+    parser.add_argument(
+        "--record", metavar="PATH", help="append the raw traffic to a capture file"
+    )
+    parser.add_argument(
+        "--replay",
+        metavar="PATH",
+        help="answer from a capture file instead of the controllers",
+    )
+    parser.add_argument(
+        "--speed",
+        type=float,
+        default=1.0,
+        help="replay speed factor, 0 replays without delays",
+    )
+    parser.add_argument("--verbose", "-v", action="store_true")
+    return parser.parse_args(argv)
+
+
+@contextlib.asynccontextmanager
+async def _session(
+    args: argparse.Namespace,
+) -> AsyncIterator[aiohttp.ClientSession | ReplaySession]:
+    """Open a session to the controllers, or to the replayed capture."""
+    if args.replay:
+        yield ReplaySession(args.replay, speed=args.speed)
+        return
+    connector = aiohttp.TCPConnector(limit_per_host=1, force_close=True)
+    async with aiohttp.ClientSession(
+        connector=connector, timeout=aiohttp.ClientTimeout(total=120)
+    ) as session:
+        yield session
+
+
+async def _poll(
+    host: str,
+    args: argparse.Namespace,
+    exporter: EH800Exporter,
+    capture: CaptureWriter | None,
+) -> None:
+    """Poll one controller until the requested number of sweeps is done."""
+    async with _session(args) as session:
+        client = OumanEH800ApiClient(
+            ip=host,
+            username=args.username,
+            password=args.password,
+            session=session,
+            capture=capture,
+        )
+        batches = build_batches(args.keys) if args.keys else REGISTERS.batches
+        sweep = 0
+        while not args.count or sweep < args.count:
+            started = time.monotonic()
+            values = None
+            try:
+                values = await client.fetch_batches(session, batches)
+            except CaptureExhaustedError:
+                _LOGGER.info("Replay of %s finished after %d sweeps", host, sweep)
+                return
+            except (
+                OumanEH800ApiClientError,
+                aiohttp.ClientError,
+                TimeoutError,
+            ) as exc:
+                # One bad controller must not stop the others, try again later.
+                _LOGGER.warning("Sweep of %s failed: %r", host, exc)
+            finally:
+                await asyncio.to_thread(client.flush_capture)
+            latency = time.monotonic() - started
+            if values is not None:
+                exporter.write(host, datetime.now(UTC), values, latency)
+                _LOGGER.debug("Sweep of %s took %.2f s", host, latency)
+            sweep += 1
+            if not args.count or sweep < args.count:
+                delay = args.interval - latency
+                if args.replay:
+                    delay = delay / args.speed if args.speed > 0 else 0
+                await asyncio.sleep(max(0, delay))
+
+
+async def _discover(host: str, args: argparse.Namespace, output: TextIO) -> None:
+    """Scan a register range of one controller and print what answered."""
+    first, _, last = args.discover.partition("-")
+    async with _session(args) as session:
+        client = OumanEH800ApiClient(
+            ip=host,
+            username=args.username,
+            password=args.password,
+            session=session,
+        )
+        found = await async_scan_registers(
+            client,
+            session,
+            register_range(int(first), int(last or first)),
+            rate=args.rate,
+        )
+    output.writelines(
+        json.dumps({"host": host, "key": key, **register}) + "\n"
+        for key, register in found.items()
+    )
+
+
+async def _run(args: argparse.Namespace, output: TextIO) -> None:
+    """Poll all controllers concurrently."""
+    if args.replay and not args.host:
+        args.host = ReplaySession(args.replay).hosts
+    if args.discover:
+        await asyncio.gather(
+            *(_discover(host, args, output) for host in args.host or [DEFAULT_IP])
+        )
+        return
+    exporter: EH800Exporter
+    if args.format == "prometheus":
+        address, _, port = args.listen.rpartition(":")
+        exporter = PrometheusExporter(address or "0.0.0.0", int(port))  # noqa: S104
+    elif args.format == "csv":
+        exporter = CsvExporter(output)
+    else:
+        exporter = JsonLinesExporter(output)
+
+    # One writer for all controllers keeps the capture a single gzip stream.
+    capture = CaptureWriter(args.record) if args.record else None
+    await exporter.start()
+    try:
+        await asyncio.gather(
+            *(
+                _poll(host, args, exporter, capture)
+                for host in args.host or [DEFAULT_IP]
+            )
+        )
+    finally:
+        await exporter.close()
+        if capture is not None:
+            await asyncio.to_thread(capture.close)
+
+
+def main(argv: list[str] | None = None) -> None:
+    """Run the poller."""
+    args = _parse_args(argv)
+    logging.basicConfig(
+        level=logging.DEBUG if args.verbose else logging.WARNING,
+        stream=sys.stderr,
+    )
+    with contextlib.ExitStack() as stack:
+        output = sys.stdout
+        if args.output:
+            output = stack.enter_context(
+                Path(args.output).open("a", encoding="utf-8", newline="")
+            )
+        with contextlib.suppress(KeyboardInterrupt):
+            asyncio.run(_run(args, output))
+
+
+if __name__ == "__main__":
+    main()
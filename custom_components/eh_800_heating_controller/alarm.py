@@ -0,0 +1,160 @@
+"""Fast alarm channel for eh-800_heating_controller."""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+from homeassistant.helpers.update_coordinator import (
+    DataUpdateCoordinator,
+    UpdateFailed,
+)
+
+from .api import OumanEH800ApiClientCommunicationError, OumanEH800ApiClientError
+from .const import EVENT_ALARM
+from .registers import REGISTERS, build_batches
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .coordinator import EH800Coordinator
+    from .data import EH800ConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+ALARM_OK = "ok"
+ALARM_LOW = "low"
+ALARM_HIGH = "high"
+ALARM_FAULT = "fault"
+# A value has to come back this far inside its limits before the alarm clears,
+# so a reading that hovers around a limit does not flood the event bus.
+HYSTERESIS = 0.5
+
+
+def evaluate(
+    value: float | str | None,
+    low: float | None,
+    high: float | None,
+    previous: str | None = None,
+) -> str:
+    """Return the alarm state of *value* against the *low* and *high* limits."""
+    if value is None or value == "ERROR":
+        return ALARM_FAULT
+    if not isinstance(value, int | float):
+        return ALARM_OK
+    if low is not None and value < low + (HYSTERESIS if previous == ALARM_LOW else 0):
+        return ALARM_LOW
+    if high is not None and value > high - (
+        HYSTERESIS if previous == ALARM_HIGH else 0
+    ):
+        return ALARM_HIGH
+    return ALARM_OK
+
+
+def _limit(key: str | None, data: dict[str, Any]) -> float | None:
+    """Return the value of the limit register *key* from a full sweep."""
+    if key is None:
+        return None
+    value = REGISTERS[key].convert(data.get(key))
+    return value if isinstance(value, int | float) else None
+
+
+class EH800AlarmCoordinator(DataUpdateCoordinator[dict[str, str]]):
+    """
+    Poll the fast tier of the EH800 and check it against its limits.
+
+    Only the registers of the fast tier and the ones with limits are read, so
+    a check costs a single request and runs on its own short interval. The
+    limits change rarely and are taken from the latest full sweep. An event
+    is fired whenever the alarm state of a register changes.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        coordinator: EH800Coordinator,
+        entry: EH800ConfigEntry,
+        interval: float,
+    ) -> None:
+        """Create the alarm coordinator."""
+        self.client = coordinator.client
+        self._coordinator = coordinator
+        self._entry = entry
+        extra = [register for register in REGISTERS.limited if register.tier != "fast"]
+        self.registers = REGISTERS.by_tier.get("fast", ()) + tuple(extra)
+        self.batches = REGISTERS.tier_batches.get("fast", ()) + build_batches(
+            register.key for register in extra
+        )
+
+        super().__init__(
+            hass,
+            _LOGGER,
+            name="Ouman EH800 Alarm Coordinator",
+            update_interval=timedelta(seconds=interval),
+            always_update=False,
+        )
+
+    async def _async_update_data(self) -> dict[str, str]:
+        """Read the monitored registers and update their alarm states."""
+        session = self.client.session
+        raw: dict[str, str] = {}
+        try:
+            for query in self.batches:
+                values = await self.client.fetch_batch(session, query, attempts=1)
+                if values and all(value == "ERROR" for value in values.values()):
+                    # Down controllers are reported once by the coordinator
+                    # instead of once per register and check.
+                    msg = f"{self.client.ip} did not answer"
+                    raise OumanEH800ApiClientCommunicationError(msg)
+                for key in query.split(";"):
+                    if key not in values:
+                        values[key] = await self.client.fetch_one(
+                            session, key, attempts=1
+                        )
+                    raw[key] = values[key]
+        except (OumanEH800ApiClientError, aiohttp.ClientError, TimeoutError) as exc:
+            msg = f"Unable to read the alarm registers: {exc}"
+            raise UpdateFailed(msg) from exc
+        finally:
+            if self.client.recording:
+                await self.hass.async_add_executor_job(self.client.flush_capture)
+        if all(value == "ERROR" for value in raw.values()):
+            msg = "The controller did not answer"
+            raise UpdateFailed(msg)
+
+        limits = self._coordinator.data or {}
+        previous = self.data or {}
+        states = {}
+        for register in self.registers:
+            value = register.convert(raw.get(register.key))
+            low = _limit(register.low_limit, limits)
+            high = _limit(register.high_limit, limits)
+            state = evaluate(value, low, high, previous.get(register.key))
+            states[register.key] = state
+            if state != previous.get(register.key) and (
+                register.key in previous or state != ALARM_OK
+            ):
+                _LOGGER.debug("Alarm state of %s is %s", register.key, state)
+                self.hass.bus.async_fire(
+                    EVENT_ALARM,
+                    {
+                        "config_entry_id": self._entry.entry_id,
+                        "key": register.key,
+                        "name": register.name,
+                        "state": state,
+                        "previous": previous.get(register.key),
+                        "value": value,
+                        "low_limit": low,
+                        "high_limit": high,
+                    },
+                )
+        return states
+
+    @property
+    def alarms(self) -> dict[str, str]:
+        """Registers that are not in the ok state."""
+        return {
+            key: state for key, state in (self.data or {}).items() if state != ALARM_OK
+        }
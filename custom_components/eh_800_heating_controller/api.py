@@ -4,13 +4,18 @@ from __future__ import annotations
 
 import asyncio
 import logging
+import time
 from typing import TYPE_CHECKING, Any
 
 import aiohttp
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from homeassistant.core import HomeAssistant
 
+    from .capture import CaptureWriter
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -44,13 +49,14 @@ def _verify_response_or_raise(response: aiohttp.ClientResponse) -> None:
 class OumanEH800ApiClient:
     """Ouman EH800 API Client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         ip: str,
         username: str,
         password: str,
         session: aiohttp.ClientSession,
-        hass: HomeAssistant,
+        hass: HomeAssistant | None = None,
+        capture: CaptureWriter | None = None,
     ) -> None:
         """EH800 API Client."""
         self._ip = ip
@@ -58,44 +64,179 @@ class OumanEH800ApiClient:
         self._password = password
         self._session = session
         self._hass = hass
+        self._capture = capture
 
-    async def fetch_value(self, session: aiohttp.ClientSession, key: str) -> str:
+    async def fetch_value(
+        self, session: aiohttp.ClientSession, key: str, attempts: int = 3
+    ) -> str:
         """Return the raw value of one endpoint."""
         url = f"http://{self._ip}/request?{key}"
         _LOGGER.debug("URL in fetch_value: %s", url)
-        for attempt in range(3):
+        for attempt in range(attempts):
+            started = time.monotonic()
             try:
                 async with session.get(
                     url, timeout=aiohttp.ClientTimeout(total=120)
                 ) as resp:
+                    if self._capture is not None:
+                        self._record(
+                            key, started, status=resp.status, body=await resp.text()
+                        )
                     resp.raise_for_status()
                     return (await resp.text()).strip()
-            except aiohttp.ClientConnectionError:
-                _LOGGER.warning(
-                    "Connection to %s refused, retry %d/2", self.ip, attempt + 1
-                )
-            await asyncio.sleep(2**attempt)
-
-        _LOGGER.error("Failed to read %s after 3 retries", key)
+            except (aiohttp.ClientConnectionError, TimeoutError) as exc:
+                if self._capture is not None:
+                    self._record(key, started, error=type(exc).__name__)
+                if isinstance(exc, TimeoutError):
+                    raise
+                if attempt < attempts - 1:
+                    _LOGGER.warning(
+                        "Connection to %s refused, retry %d/%d",
+                        self.ip,
+                        attempt + 1,
+                        attempts - 1,
+                    )
+                    await asyncio.sleep(2**attempt)
+
+        # Single reads such as discovery probes are expected to fail and leave
+        # reporting to the caller.
+        _LOGGER.log(
+            logging.ERROR if attempts > 1 else logging.DEBUG,
+            "Failed to read %s after %d attempts",
+            key,
+            attempts,
+        )
         return "ERROR"
 
+    def _record(self, key: str, started: float, **exchange: Any) -> None:
+        """Add one exchange to the traffic capture."""
+        duration = time.monotonic() - started
+        self._capture.record(  # type: ignore[union-attr]
+            time.time() - duration, self._ip, key, duration, **exchange
+        )
+
+    def flush_capture(self) -> None:
+        """Write the captured traffic to disk. Does blocking file I/O."""
+        if self._capture is not None:
+            self._capture.flush()
+
+    def close_capture(self) -> None:
+        """Write the captured traffic and close the capture. Does blocking file I/O."""
+        if self._capture is not None:
+            self._capture.close()
+
+    async def fetch_one(
+        self, session: aiohttp.ClientSession, key: str, attempts: int = 3
+    ) -> str:
+        """Return the value of one key with the response framing removed."""
+        value = await self.fetch_value(key=key, session=session, attempts=attempts)
+        replase_str: str = "request?" + key
+        result_r = str(value).replace(replase_str, "")
+        result_r = result_r.replace(";", "")
+        result_r = result_r.replace("=", "")
+        return result_r.replace("\x00", "")
+
     async def fetch_all(self, session: aiohttp.ClientSession, keys: list) -> Any:
         """Run all fetches concurrently and return a dict {key: value}."""
         results = {}
         for key in keys:
-            value = await self.fetch_value(key=key, session=session)
-            replase_str: str = "request?" + key
-            result_r = str(value).replace(replase_str, "")
-            result_r = result_r.replace(";", "")
-            result_r = result_r.replace("=", "")
-            result_r = result_r.replace("\x00", "")
+            result_r = await self.fetch_one(session, key)
             results[key] = result_r
             _LOGGER.debug("Value: %s : %s", key, result_r)
             # Optional: give the device a tiny break
             await asyncio.sleep(0.1)
         return results
 
+    async def fetch_batch(
+        self, session: aiohttp.ClientSession, query: str, attempts: int = 3
+    ) -> dict[str, str]:
+        """
+        Return the values of the `;` separated keys in *query* in one request.
+
+        The controller answers with `request?KEY=value;KEY=value;`. Keys it
+        does not answer are left out of the result.
+        """
+        body = await self.fetch_value(session, query, attempts=attempts)
+        if body == "ERROR":
+            return dict.fromkeys(query.split(";"), "ERROR")
+        body = body.replace("\x00", "").removeprefix("request?")
+        results = {}
+        for pair in body.split(";"):
+            key, separator, value = pair.partition("=")
+            if separator:
+                results[key.strip()] = value.strip()
+        return results
+
+    async def fetch_batches(
+        self, session: aiohttp.ClientSession, batches: Iterable[str]
+    ) -> dict[str, str]:
+        """
+        Read the precomputed request strings in *batches* and return {key: value}.
+
+        Keys missing from an answer are read one at a time, so firmware that
+        only answers single keys still works.
+        """
+        results = {}
+        for query in batches:
+            values = await self.fetch_batch(session, query)
+            for key in query.split(";"):
+                if key not in values:
+                    values[key] = await self.fetch_one(session, key)
+                results[key] = values[key]
+                _LOGGER.debug("Value: %s : %s", key, results[key])
+            # Optional: give the device a tiny break
+            await asyncio.sleep(0.1)
+        return results
+
+    async def fetch_trend(
+        self,
+        session: aiohttp.ClientSession,
+        key: str,
+        since: int,
+        count: int,
+    ) -> list[tuple[int, float]]:
+        """
+        Return up to *count* trend samples of *key* taken after *since*.
+
+        The controller answers with one `<unix time>,<value>` row per sample.
+        Rows that do not parse are skipped.
+        """
+        query = f"{key}&{since}&{count}"
+        url = f"http://{self._ip}/trend?{query}"
+        _LOGGER.debug("URL in fetch_trend: %s", url)
+        started = time.monotonic()
+        try:
+            async with session.get(
+                url, timeout=aiohttp.ClientTimeout(total=120)
+            ) as resp:
+                body = await resp.text()
+                if self._capture is not None:
+                    self._record(query, started, status=resp.status, body=body)
+                _verify_response_or_raise(resp)
+        except (aiohttp.ClientConnectionError, TimeoutError) as exc:
+            if self._capture is not None:
+                self._record(query, started, error=type(exc).__name__)
+            raise
+        samples = []
+        for row in body.replace("\x00", "").splitlines():
+            timestamp, _, value = row.strip().rstrip(";").partition(",")
+            try:
+                samples.append((int(timestamp), float(value)))
+            except ValueError:
+                continue
+        return samples
+
     @property
     def ip(self) -> str | None:
         """IP address of the client."""
         return self._ip
+
+    @property
+    def recording(self) -> bool:
+        """Return True when the traffic is captured."""
+        return self._capture is not None
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        """Session the client was created with."""
+        return self._session
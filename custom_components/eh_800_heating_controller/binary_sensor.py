@@ -0,0 +1,67 @@
+"""Binary sensor platform for eh-800_heating_controller."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.binary_sensor import (
+    BinarySensorDeviceClass,
+    BinarySensorEntity,
+    BinarySensorEntityDescription,
+)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+from .alarm import EH800AlarmCoordinator
+from .const import CONF_IP, DEVICE_NAME
+from .entity import device_info
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+
+    from .data import EH800ConfigEntry
+
+ALARM_DESCRIPTION = BinarySensorEntityDescription(
+    key="alarm",
+    name=f"{DEVICE_NAME} Alarm",
+    icon="mdi:alert-circle-outline",
+    device_class=BinarySensorDeviceClass.PROBLEM,
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,  # noqa: ARG001
+    entry: EH800ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the alarm sensor from a config entry."""
+    alarm = entry.runtime_data.alarm
+    if alarm is None:
+        return
+    async_add_entities([EH800AlarmSensor(alarm, ALARM_DESCRIPTION, entry)])
+
+
+class EH800AlarmSensor(CoordinatorEntity[EH800AlarmCoordinator], BinarySensorEntity):
+    """On while a register of the alarm channel is out of range or faulty."""
+
+    def __init__(
+        self,
+        coordinator: EH800AlarmCoordinator,
+        description: BinarySensorEntityDescription,
+        entry: EH800ConfigEntry,
+    ) -> None:
+        """Sensor initialization."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{entry.data[CONF_IP]}_{description.key}"
+        self._attr_device_info = device_info(entry)
+
+    @property
+    def is_on(self) -> bool:
+        """Return True while an alarm is active."""
+        return bool(self.coordinator.alarms)
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Active alarms by register."""
+        return {"alarms": self.coordinator.alarms}
@@ -0,0 +1,207 @@
+"""Traffic capture and replay for eh-800_heating_controller."""
+
+from __future__ import annotations
+
+import asyncio
+import gzip
+import json
+import logging
+import threading
+import zlib
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import IO, TYPE_CHECKING, Any, Self
+from urllib.parse import urlsplit
+
+import aiohttp
+
+from .api import OumanEH800ApiClientError
+
+if TYPE_CHECKING:
+    from types import TracebackType
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class CaptureExhaustedError(OumanEH800ApiClientError):
+    """Exception to indicate that a replayed capture has no more responses."""
+
+
+def _open(path: Path, mode: str) -> IO[str]:
+    """Open a capture file, gzip compressed when it ends with .gz."""
+    if path.suffix == ".gz":
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return path.open(mode, encoding="utf-8")
+
+
+def _read(path: Path) -> str:
+    """Return the text of a capture file, also while it is being written."""
+    data = path.read_bytes()
+    if path.suffix != ".gz":
+        return data.decode("utf-8")
+    # Every run appends a gzip member, and the member of a running capture
+    # has no end yet, which gzip.open refuses to read.
+    chunks = []
+    while data:
+        decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+        chunks.append(decompressor.decompress(data))
+        data = decompressor.unused_data
+    return b"".join(chunks).decode("utf-8")
+
+
+class CaptureWriter:
+    """
+    Collect request/response pairs and append them to a capture file.
+
+    Every exchange is one JSON line: wall clock time `t`, host `h`, query `k`,
+    duration `d` and either the status `s` and raw body `b` or the error `e`.
+    Records are buffered in memory and written by `flush` to a file that stays
+    open until `close`, so a gzip capture is one stream instead of a member
+    per flush. Both do blocking file I/O and should run in an executor inside
+    Home Assistant.
+    """
+
+    def __init__(self, path: str | Path) -> None:
+        """Append to *path*."""
+        self.path = Path(path)
+        self._pending: deque[str] = deque()
+        self._file: IO[str] | None = None
+        # The poll and the alarm channel flush from different threads.
+        self._lock = threading.Lock()
+
+    def record(  # noqa: PLR0913
+        self,
+        timestamp: float,
+        host: str | None,
+        key: str,
+        duration: float,
+        status: int | None = None,
+        body: str | None = None,
+        error: str | None = None,
+    ) -> None:
+        """Buffer one exchange."""
+        record: dict[str, Any] = {
+            "t": round(timestamp, 3),
+            "h": host,
+            "k": key,
+            "d": round(duration, 4),
+        }
+        if error is None:
+            record["s"] = status
+            record["b"] = body
+        else:
+            record["e"] = error
+        self._pending.append(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def flush(self) -> None:
+        """Write the buffered exchanges so far to the capture file."""
+        with self._lock:
+            if not self._pending:
+                return
+            if self._file is None:
+                self._file = _open(self.path, "a")
+            while self._pending:
+                self._file.write(self._pending.popleft())
+            # Sync flush, readers see every complete record of a running capture.
+            self._file.flush()
+
+    def close(self) -> None:
+        """Write the buffered exchanges and close the capture file."""
+        self.flush()
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+
+def read_capture(path: str | Path) -> list[dict[str, Any]]:
+    """
+    Return the exchanges stored in a capture file.
+
+    A last line cut off by a crash of the recording run is skipped.
+    """
+    return [
+        json.loads(line)
+        for line in _read(Path(path)).splitlines(keepends=True)
+        if line.strip() and line.endswith("\n")
+    ]
+
+
+class _ReplayResponse:
+    """The subset of aiohttp.ClientResponse used by the API client."""
+
+    def __init__(self, record: dict[str, Any], speed: float) -> None:
+        self._record = record
+        self._speed = speed
+        self.status: int = record.get("s") or 0
+
+    async def __aenter__(self) -> Self:
+        if self._speed > 0:
+            await asyncio.sleep(self._record["d"] / self._speed)
+        error = self._record.get("e")
+        if error == "TimeoutError":
+            raise TimeoutError
+        if error is not None:
+            raise aiohttp.ClientConnectionError(error)
+        return self
+
+    async def __aexit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        tb: TracebackType | None,
+    ) -> None:
+        return None
+
+    async def text(self) -> str:
+        return self._record.get("b") or ""
+
+    def raise_for_status(self) -> None:
+        if self.status >= 400:  # noqa: PLR2004
+            raise aiohttp.ClientResponseError(
+                None,  # type: ignore[arg-type]
+                (),
+                status=self.status,
+                message="Replayed error",
+            )
+
+
+class ReplaySession:
+    """
+    Stand-in for aiohttp.ClientSession that answers from a capture.
+
+    Pass it as the session of the API client or the coordinator. Responses for
+    each host and key are returned in the order they were recorded, delayed by
+    the recorded duration divided by *speed* (0 answers immediately).
+    """
+
+    def __init__(self, path: str | Path, speed: float = 1.0) -> None:
+        """Load the capture in *path*."""
+        self._speed = speed
+        self._responses: dict[tuple[str | None, str], deque[dict[str, Any]]] = (
+            defaultdict(deque)
+        )
+        for record in read_capture(path):
+            self._responses[record["h"], record["k"]].append(record)
+        _LOGGER.debug("Loaded %d responses from %s", len(self), path)
+
+    def __len__(self) -> int:
+        """Return the number of responses left."""
+        return sum(len(responses) for responses in self._responses.values())
+
+    @property
+    def hosts(self) -> list[str | None]:
+        """Hosts that appear in the capture."""
+        return sorted({host for host, _ in self._responses}, key=str)
+
+    def get(self, url: str, **_kwargs: Any) -> _ReplayResponse:
+        """Return the next recorded response to *url*."""
+        parts = urlsplit(url)
+        responses = self._responses.get((parts.netloc, parts.query))
+        if not responses:
+            msg = f"No recorded response left for {url}"
+            raise CaptureExhaustedError(msg)
+        return _ReplayResponse(responses.popleft(), self._speed)
+
+    async def close(self) -> None:
+        """Close the session."""
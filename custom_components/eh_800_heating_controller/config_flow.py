@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+from typing import TYPE_CHECKING, Any
 
 import voluptuous as vol
 from homeassistant import config_entries
@@ -21,17 +22,85 @@ from .api import (
     OumanEH800ApiClientError,
 )
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_ALARM_INTERVAL,
+    CONF_EXTRA_REGISTERS,
     CONF_IP,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PHASE_ALIGNED,
+    CONF_RECORD_TRAFFIC,
     CONF_SCAN_INTERVAL,
+    CONF_TREND_IMPORT,
+    DEFAULT_ALARM_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
     DEFAULT_SCAN_INTERVAL,
     DOMAIN,
     LOGGER,
-    SENSOR_DESCRIPTIONS,
 )
+from .registers import REGISTERS
+from .store import async_load_registers
+
+if TYPE_CHECKING:
+    from collections.abc import Mapping
 
 _LOGGER = logging.getLogger(__name__)
 
 
+def _adaptive_polling_schema(defaults: Mapping[str, Any]) -> dict:
+    """Return the form fields for adaptive and phase aligned polling."""
+    return {
+        vol.Optional(
+            CONF_ADAPTIVE_POLLING,
+            default=defaults.get(CONF_ADAPTIVE_POLLING, False),
+        ): selector.BooleanSelector(),
+        vol.Optional(
+            CONF_MIN_SCAN_INTERVAL,
+            default=defaults.get(CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL),
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=10,
+                max=3600,
+                step=10,
+                unit_of_measurement="seconds",
+            ),
+        ),
+        vol.Optional(
+            CONF_MAX_SCAN_INTERVAL,
+            default=defaults.get(CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL),
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=10,
+                max=3600,
+                step=10,
+                unit_of_measurement="seconds",
+            ),
+        ),
+        vol.Optional(
+            CONF_PHASE_ALIGNED,
+            default=defaults.get(CONF_PHASE_ALIGNED, False),
+        ): selector.BooleanSelector(),
+    }
+
+
+def _alarm_schema(defaults: Mapping[str, Any]) -> dict:
+    """Return the form field for the alarm channel."""
+    return {
+        vol.Optional(
+            CONF_ALARM_INTERVAL,
+            default=defaults.get(CONF_ALARM_INTERVAL, DEFAULT_ALARM_INTERVAL),
+        ): selector.NumberSelector(
+            selector.NumberSelectorConfig(
+                min=0,
+                max=300,
+                step=5,
+                unit_of_measurement="seconds",
+            ),
+        ),
+    }
+
+
 class OumanEH800FlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
     """Config flow for OumanEH800."""
 
@@ -107,6 +176,8 @@ class OumanEH800FlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                             unit_of_measurement="minutes",
                         ),
                     ),
+                    **_adaptive_polling_schema(user_input or {}),
+                    **_alarm_schema(user_input or {}),
                 },
             ),
             errors=_errors,
@@ -152,6 +223,27 @@ class OumanEH800FlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                 await self.hass.config_entries.async_reload(self.config_entry.entry_id)
                 return self.async_abort(reason="reconfigure_successful")
 
+        # Registers found by the discover_registers service can be enabled here
+        discovered = [
+            key
+            for key in await async_load_registers(self.hass, config_entry.entry_id)
+            if key not in REGISTERS
+        ]
+        extra_registers = {}
+        if discovered:
+            extra_registers[
+                vol.Optional(
+                    CONF_EXTRA_REGISTERS,
+                    default=self.config_entry.data.get(CONF_EXTRA_REGISTERS, []),
+                )
+            ] = selector.SelectSelector(
+                selector.SelectSelectorConfig(
+                    options=discovered,
+                    multiple=True,
+                    mode=selector.SelectSelectorMode.DROPDOWN,
+                ),
+            )
+
         # Pre-fill the form with existing data
         return self.async_show_form(
             step_id="reconfigure",
@@ -189,6 +281,17 @@ class OumanEH800FlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
                             unit_of_measurement="minutes",
                         ),
                     ),
+                    **_adaptive_polling_schema(self.config_entry.data),
+                    **_alarm_schema(self.config_entry.data),
+                    **extra_registers,
+                    vol.Optional(
+                        CONF_RECORD_TRAFFIC,
+                        default=self.config_entry.data.get(CONF_RECORD_TRAFFIC, False),
+                    ): selector.BooleanSelector(),
+                    vol.Optional(
+                        CONF_TREND_IMPORT,
+                        default=self.config_entry.data.get(CONF_TREND_IMPORT, False),
+                    ): selector.BooleanSelector(),
                 },
             ),
             errors=_errors,
@@ -203,5 +306,6 @@ class OumanEH800FlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
             session=async_create_clientsession(self.hass),
             hass=self.hass,
         )
-        keys = list(SENSOR_DESCRIPTIONS.keys())
-        await client.fetch_all(session=async_create_clientsession(self.hass), keys=keys)
+        await client.fetch_batches(
+            session=async_create_clientsession(self.hass), batches=REGISTERS.batches
+        )
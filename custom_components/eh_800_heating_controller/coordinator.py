@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import logging
+import time
 from datetime import timedelta
 from typing import TYPE_CHECKING, Any
 
@@ -11,7 +12,19 @@ from homeassistant.helpers.update_coordinator import (
     UpdateFailed,
 )
 
-from .const import CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL
+from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_MAX_SCAN_INTERVAL,
+    CONF_MIN_SCAN_INTERVAL,
+    CONF_PHASE_ALIGNED,
+    CONF_SCAN_INTERVAL,
+    DEFAULT_MAX_SCAN_INTERVAL,
+    DEFAULT_MIN_SCAN_INTERVAL,
+    DEFAULT_SCAN_INTERVAL,
+    TREND_INTERVAL_KEY,
+)
+from .polling import LATENCY_FACTOR, AdaptiveInterval, PhaseTracker, parse_number
+from .registers import REGISTERS, build_batches
 
 if TYPE_CHECKING:
     import aiohttp
@@ -40,8 +53,28 @@ class EH800Coordinator(DataUpdateCoordinator):
         self._entry = entry
         self.ip = client.ip
         self.keys = keys
+        # The whole register map is read with its precomputed request strings,
+        # discovered registers on top of it get their own.
+        self.batches = REGISTERS.batches + build_batches(
+            key for key in keys if key not in REGISTERS
+        )
         self.client = client
         self.hass = hass
+        self.last_latency: float | None = None
+        self.adaptive: AdaptiveInterval | None = None
+        if entry.data.get(CONF_ADAPTIVE_POLLING, False):
+            self.adaptive = AdaptiveInterval(
+                min_interval=self._get_seconds(
+                    CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                ),
+                max_interval=self._get_seconds(
+                    CONF_MAX_SCAN_INTERVAL, DEFAULT_MAX_SCAN_INTERVAL
+                ),
+                initial_interval=self.get_interval(),
+            )
+        self.phase: PhaseTracker | None = None
+        if entry.data.get(CONF_PHASE_ALIGNED, False):
+            self.phase = PhaseTracker()
         update_interval_timedelta = timedelta(seconds=self.get_interval())
 
         super().__init__(
@@ -54,11 +87,64 @@ class EH800Coordinator(DataUpdateCoordinator):
 
     async def _async_update_data(self) -> Any:
         """Fetch data from EH800."""
+        started = time.monotonic()
         try:
-            return await self.client.fetch_all(self._session, self.keys)
+            data = await self.client.fetch_batches(self._session, self.batches)
         except Exception as exc:
             _LOGGER.exception("Unable to update EH800:")
             raise UpdateFailed from exc
+        finally:
+            if self.client.recording:
+                await self.hass.async_add_executor_job(self.client.flush_capture)
+        finished = time.monotonic()
+        self.last_latency = finished - started
+
+        interval = self.get_interval()
+        if self.adaptive is not None:
+            interval = self.adaptive.observe(data, self.last_latency)
+            _LOGGER.debug(
+                "Adaptive polling: interval %.0f s (changed: %s)",
+                interval,
+                self.adaptive.changed_keys,
+            )
+        if self.phase is not None:
+            self.phase.observe(
+                data,
+                started,
+                finished,
+                parse_number(data.get(TREND_INTERVAL_KEY)),
+            )
+            # Probes may come sooner than the interval, but never sooner than
+            # the configured minimum or the latency floor.
+            if self.adaptive is not None:
+                min_delay = self.adaptive.floor
+            else:
+                min_delay = max(
+                    self._get_seconds(
+                        CONF_MIN_SCAN_INTERVAL, DEFAULT_MIN_SCAN_INTERVAL
+                    ),
+                    self.last_latency * LATENCY_FACTOR,
+                )
+            interval = self.phase.next_delay(time.monotonic(), interval, min_delay)
+            _LOGGER.debug("Phase aligned polling: next update in %.1f s", interval)
+        # The next refresh is scheduled with this value once we return.
+        self.update_interval = timedelta(seconds=interval)
+        return data
+
+    @property
+    def polling_attributes(self) -> dict[str, Any]:
+        """Diagnostic attributes describing how the device is polled."""
+        attributes: dict[str, Any] = {
+            "adaptive": self.adaptive is not None,
+            "latency": None
+            if self.last_latency is None
+            else round(self.last_latency, 3),
+        }
+        if self.adaptive is not None:
+            attributes.update(self.adaptive.attributes)
+        if self.phase is not None:
+            attributes.update(self.phase.attributes)
+        return attributes
 
     # coordinator.py
 
@@ -73,3 +159,12 @@ class EH800Coordinator(DataUpdateCoordinator):
                 "Invalid scan_interval %s, falling back to default", interval
             )
             return DEFAULT_SCAN_INTERVAL * 60
+
+    def _get_seconds(self, conf_key: str, default: int) -> float:
+        """Return an interval bound in seconds from the config entry."""
+        value = self._entry.data.get(conf_key, default)
+        try:
+            return int(value)
+        except (TypeError, ValueError):
+            _LOGGER.warning("Invalid %s %s, falling back to default", conf_key, value)
+            return default
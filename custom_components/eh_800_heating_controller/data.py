@@ -2,13 +2,14 @@
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import TYPE_CHECKING
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
     from homeassistant.config_entries import ConfigEntry
     from homeassistant.loader import Integration
 
+    from .alarm import EH800AlarmCoordinator
     from .api import OumanEH800ApiClient
     from .coordinator import EH800Coordinator
 
@@ -23,3 +24,5 @@ class EH800Data:
     client: OumanEH800ApiClient
     coordinator: EH800Coordinator
     integration: Integration
+    registers: dict[str, dict[str, Any]] = field(default_factory=dict)
+    alarm: EH800AlarmCoordinator | None = None
@@ -0,0 +1,114 @@
+"""Register discovery for eh-800_heating_controller."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from .api import OumanEH800ApiClientError
+from .registers import REGISTERS, Register
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable
+
+    from .api import OumanEH800ApiClient
+
+_LOGGER = logging.getLogger(__name__)
+
+# Values that mean the register did not answer.
+_NO_VALUE = ("", "ERROR")
+
+
+def register_range(first: int, last: int, suffix: int = 85) -> list[str]:
+    """Return the keys S_<first>_<suffix> .. S_<last>_<suffix>."""
+    return [f"S_{number}_{suffix}" for number in range(first, last + 1)]
+
+
+def classify_value(value: str) -> str | None:
+    """Return the rough type of a register value or None when it is missing."""
+    if value in _NO_VALUE:
+        return None
+    try:
+        int(value)
+    except ValueError:
+        pass
+    else:
+        return "integer"
+    try:
+        float(value)
+    except ValueError:
+        return "text"
+    return "float"
+
+
+def describe_register(key: str, register: dict[str, Any]) -> Register:
+    """Return the register map entry of *key*, or one for a discovered register."""
+    known = REGISTERS.get(key)
+    if known is not None:
+        return known
+    if register.get("type") == "text":
+        return Register(
+            key=key, name=f"Register {key}", type="text", icon="mdi:text-box-outline"
+        )
+    return Register(
+        key=key,
+        name=f"Register {key}",
+        type=register.get("type", "float"),
+        icon="mdi:numeric",
+        state_class="measurement",
+    )
+
+
+class _RateLimiter:
+    """Space out requests to at most *rate* per second."""
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1 / rate if rate > 0 else 0
+        self._next = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self._lock:
+            now = asyncio.get_running_loop().time()
+            if self._next > now:
+                await asyncio.sleep(self._next - now)
+            self._next = max(now, self._next) + self._interval
+
+
+async def async_scan_registers(
+    client: OumanEH800ApiClient,
+    session: aiohttp.ClientSession,
+    keys: Iterable[str],
+    concurrency: int = 1,
+    rate: float = 2.0,
+) -> dict[str, dict[str, Any]]:
+    """
+    Probe *keys* on the controller and return the ones that answered.
+
+    At most *concurrency* requests are in flight and at most *rate* are started
+    per second, so the scan does not starve the regular polling. Each register
+    is read once without retries. The result maps the key to its rough value
+    type and the sample that was read.
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    limiter = _RateLimiter(rate)
+    found: dict[str, dict[str, Any]] = {}
+
+    async def probe(key: str) -> None:
+        async with semaphore:
+            await limiter.wait()
+            try:
+                value = await client.fetch_one(session, key, attempts=1)
+            except (OumanEH800ApiClientError, aiohttp.ClientError, TimeoutError) as exc:
+                _LOGGER.debug("Register %s did not answer: %s", key, exc)
+                return
+            value_type = classify_value(value)
+            if value_type is not None:
+                found[key] = {"type": value_type, "sample": value}
+
+    await asyncio.gather(*(probe(key) for key in keys))
+    _LOGGER.debug("Discovered %d registers", len(found))
+    return dict(sorted(found.items()))
@@ -0,0 +1,24 @@
+"""Shared entity helpers for eh-800_heating_controller."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+
+from .const import CONF_IP, DEVICE_NAME, DOMAIN
+
+if TYPE_CHECKING:
+    from .data import EH800ConfigEntry
+
+
+def device_info(entry: EH800ConfigEntry) -> DeviceInfo:
+    """Return the logical EH800 device the entities of *entry* belong to."""
+    return DeviceInfo(
+        identifiers={(DOMAIN, entry.entry_id)},
+        name=DEVICE_NAME,
+        manufacturer="Jari Kaipio",
+        model=DEVICE_NAME,
+        configuration_url=f"http://{entry.data[CONF_IP]}/",
+        entry_type=DeviceEntryType.SERVICE,
+    )
@@ -0,0 +1,179 @@
+"""Reading exporters for the headless EH800 poller."""
+
+from __future__ import annotations
+
+import csv
+import json
+import logging
+import os
+from typing import TYPE_CHECKING, Any, TextIO
+
+from aiohttp import web
+
+from .polling import parse_number
+from .registers import REGISTERS
+
+if TYPE_CHECKING:
+    from datetime import datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _is_empty(stream: TextIO) -> bool:
+    """Return True unless *stream* is a file that already has content."""
+    try:
+        return os.fstat(stream.fileno()).st_size == 0
+    except (OSError, ValueError):
+        # Not backed by a file, such as a StringIO.
+        return True
+
+
+class EH800Exporter:
+    """Base class for exporters. Each sweep is written and then forgotten."""
+
+    async def start(self) -> None:
+        """Prepare the exporter."""
+
+    def write(
+        self,
+        host: str,
+        timestamp: datetime,
+        values: dict[str, Any],
+        latency: float,
+    ) -> None:
+        """Export the readings of one sweep."""
+        raise NotImplementedError
+
+    async def close(self) -> None:
+        """Release the resources of the exporter."""
+
+
+class JsonLinesExporter(EH800Exporter):
+    """Write one JSON object per sweep."""
+
+    def __init__(self, stream: TextIO) -> None:
+        """Write to *stream*."""
+        self._stream = stream
+
+    def write(
+        self,
+        host: str,
+        timestamp: datetime,
+        values: dict[str, Any],
+        latency: float,
+    ) -> None:
+        """Export the readings of one sweep."""
+        record = {
+            "time": timestamp.isoformat(),
+            "host": host,
+            "latency": round(latency, 3),
+            "values": values,
+        }
+        self._stream.write(json.dumps(record, separators=(",", ":")) + "\n")
+        self._stream.flush()
+
+
+class CsvExporter(EH800Exporter):
+    """Write one CSV row per reading: time, host, key, value."""
+
+    def __init__(self, stream: TextIO) -> None:
+        """Write to *stream*."""
+        self._stream = stream
+        self._writer = csv.writer(stream)
+        # --output appends, so only a new or empty file gets the header.
+        if _is_empty(stream):
+            self._writer.writerow(["time", "host", "key", "value"])
+
+    def write(
+        self,
+        host: str,
+        timestamp: datetime,
+        values: dict[str, Any],
+        latency: float,  # noqa: ARG002
+    ) -> None:
+        """Export the readings of one sweep."""
+        time = timestamp.isoformat()
+        self._writer.writerows(
+            [time, host, key, value] for key, value in values.items()
+        )
+        self._stream.flush()
+
+
+class PrometheusExporter(EH800Exporter):
+    """Serve the latest reading of every key in the Prometheus text format."""
+
+    def __init__(self, host: str, port: int) -> None:
+        """Listen on *host*:*port*."""
+        self._host = host
+        self._port = port
+        self._runner: web.AppRunner | None = None
+        # Only the latest sample of each series is kept.
+        self._values: dict[tuple[str, str], float] = {}
+        self._latency: dict[str, float] = {}
+        self._sweeps: dict[str, int] = {}
+
+    async def start(self) -> None:
+        """Start the HTTP server."""
+        app = web.Application()
+        app.router.add_get("/metrics", self._handle_metrics)
+        self._runner = web.AppRunner(app)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self._host, self._port).start()
+        _LOGGER.info("Serving metrics on http://%s:%d/metrics", self._host, self._port)
+
+    def write(
+        self,
+        host: str,
+        timestamp: datetime,  # noqa: ARG002
+        values: dict[str, Any],
+        latency: float,
+    ) -> None:
+        """Export the readings of one sweep."""
+        for key, raw in values.items():
+            register = REGISTERS.get(key)
+            value = parse_number(raw) if register is None else register.convert(raw)
+            if not isinstance(value, float | int):
+                self._values.pop((host, key), None)
+            else:
+                self._values[host, key] = value
+        self._latency[host] = latency
+        self._sweeps[host] = self._sweeps.get(host, 0) + 1
+
+    def render(self) -> str:
+        """Return the metrics in the Prometheus text format."""
+        lines = [
+            "# HELP eh800_value Latest value of an EH800 register.",
+            "# TYPE eh800_value gauge",
+        ]
+        for (host, key), value in sorted(self._values.items()):
+            register = REGISTERS.get(key)
+            name = key if register is None else register.name
+            lines.append(
+                f'eh800_value{{host="{host}",key="{key}",name="{name}"}} {value}'
+            )
+        lines += [
+            "# HELP eh800_sweep_duration_seconds Duration of the latest sweep.",
+            "# TYPE eh800_sweep_duration_seconds gauge",
+        ]
+        lines += [
+            f'eh800_sweep_duration_seconds{{host="{host}"}} {latency}'
+            for host, latency in sorted(self._latency.items())
+        ]
+        lines += [
+            "# HELP eh800_sweeps_total Number of completed sweeps.",
+            "# TYPE eh800_sweeps_total counter",
+        ]
+        lines += [
+            f'eh800_sweeps_total{{host="{host}"}} {count}'
+            for host, count in sorted(self._sweeps.items())
+        ]
+        return "\n".join(lines) + "\n"
+
+    async def _handle_metrics(self, _request: web.Request) -> web.Response:
+        """Serve the metrics."""
+        return web.Response(text=self.render(), content_type="text/plain")
+
+    async def close(self) -> None:
+        """Stop the HTTP server."""
+        if self._runner is not None:
+            await self._runner.cleanup()
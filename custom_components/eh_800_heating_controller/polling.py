@@ -0,0 +1,259 @@
+"""Adaptive polling helpers for eh-800_heating_controller."""
+
+from __future__ import annotations
+
+import math
+import statistics
+from collections import deque
+from typing import Any
+
+# How many recent samples of each key are kept for the variance estimate.
+HISTORY_LENGTH = 8
+# Changes smaller than this are considered noise (the device reports 0.1 steps).
+CHANGE_DEADBAND = 0.15
+# Shrink the interval this much when something moves, grow it when it does not.
+SHRINK_FACTOR = 0.5
+GROW_FACTOR = 1.5
+# Never poll more often than this many times the duration of one full sweep.
+LATENCY_FACTOR = 4
+# Read this long after the expected refresh of the controller's measurements.
+ALIGN_MARGIN = 2.0
+# Never schedule an aligned read sooner than this.
+MIN_ALIGNED_DELAY = 5.0
+# Alignment is skipped unless the period is at least this many sweeps long.
+MIN_PERIOD_SWEEPS = 3
+# The refresh instant is considered known once it is narrowed down this far
+# (plus the shortest delay between reads and the duration of two sweeps).
+PHASE_TOLERANCE = 10.0
+# While it is not, reads go to the start, middle and end of the phase window.
+PROBE_POINTS = (0.0, 0.5, 1.0)
+
+
+def parse_number(value: Any) -> float | None:
+    """Return *value* as a float or None if it is not numeric."""
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class AdaptiveInterval:
+    """
+    Widen or narrow the polling interval based on how fast values change.
+
+    Every sweep is fed to `observe` together with the time it took. When any
+    key moved more than the deadband the interval is halved, and when all keys
+    have settled (recent variance inside the deadband) it grows again. The
+    result is always kept within the configured bounds and never below a few
+    times the observed sweep duration, so a slow controller is not hammered.
+    """
+
+    def __init__(
+        self,
+        min_interval: float,
+        max_interval: float,
+        initial_interval: float,
+    ) -> None:
+        """Create the tracker with bounds in seconds."""
+        self.min_interval = min(min_interval, max_interval)
+        self.max_interval = max(min_interval, max_interval)
+        self.latency: float | None = None
+        self.interval = self._clamp(initial_interval)
+        self.changed_keys: list[str] = []
+        self._history: dict[str, deque[float]] = {}
+
+    @property
+    def floor(self) -> float:
+        """Return the shortest allowed interval, the latency floor included."""
+        if self.latency is None:
+            return self.min_interval
+        return max(self.min_interval, self.latency * LATENCY_FACTOR)
+
+    def _clamp(self, interval: float) -> float:
+        """Keep *interval* within the bounds and above the latency floor."""
+        return max(self.floor, min(self.max_interval, interval))
+
+    def observe(self, values: dict[str, Any], latency: float) -> float:
+        """Record one sweep and return the next interval in seconds."""
+        self.latency = latency
+        changed = []
+        settled = True
+        for key, raw in values.items():
+            value = parse_number(raw)
+            if value is None:
+                continue
+            history = self._history.setdefault(key, deque(maxlen=HISTORY_LENGTH))
+            if history and abs(value - history[-1]) > CHANGE_DEADBAND:
+                changed.append(key)
+            history.append(value)
+            if len(history) > 1 and statistics.pstdev(history) > CHANGE_DEADBAND:
+                settled = False
+
+        self.changed_keys = changed
+        if changed:
+            self.interval = self._clamp(self.interval * SHRINK_FACTOR)
+        elif settled:
+            self.interval = self._clamp(self.interval * GROW_FACTOR)
+        else:
+            self.interval = self._clamp(self.interval)
+        return self.interval
+
+    def variances(self) -> dict[str, float]:
+        """Return the recent variance of every numeric key."""
+        return {
+            key: round(statistics.pvariance(history), 4)
+            for key, history in self._history.items()
+            if len(history) > 1
+        }
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Diagnostic attributes describing the current state."""
+        variances = self.variances()
+        return {
+            "min_interval": self.min_interval,
+            "max_interval": self.max_interval,
+            "latency": None if self.latency is None else round(self.latency, 3),
+            "changed_keys": self.changed_keys,
+            "most_variable_keys": sorted(
+                variances, key=variances.__getitem__, reverse=True
+            )[:5],
+            "variances": variances,
+        }
+
+
+class PhaseTracker:
+    """
+    Learn when the controller refreshes its measurements.
+
+    The update period comes from the trend sampling interval (`S_26_85`). The
+    phase is narrowed down from sweeps that saw a value change: the refresh
+    must have happened between the previous sweep starting and the current one
+    finishing. Intersecting those windows modulo the period converges on the
+    refresh instant. While the window is still wide, reads are placed at its
+    start, middle and end (a binary search), afterwards they land just after
+    the refresh.
+    """
+
+    def __init__(self) -> None:
+        """Create an empty tracker."""
+        self.period: float | None = None
+        # Window of possible refresh instants: start offset and width.
+        self._phase_start: float | None = None
+        self._phase_width: float = 0.0
+        self._probe_step = 0
+        self._sweep_duration = 0.0
+        self._min_delay = MIN_ALIGNED_DELAY
+        self._previous_start: float | None = None
+        self._previous_values: dict[str, Any] = {}
+
+    def observe(
+        self,
+        values: dict[str, Any],
+        started: float,
+        finished: float,
+        period: float | None,
+    ) -> None:
+        """Record one sweep that ran from *started* to *finished*."""
+        self._sweep_duration = finished - started
+        if period is not None and period > 0:
+            if period != self.period:
+                self._phase_start = None
+            self.period = period
+        changed = any(
+            self._previous_values.get(key) != value
+            for key, value in values.items()
+            if parse_number(value) is not None
+        )
+        if changed and self._previous_start is not None and self.period:
+            self._narrow(self._previous_start, finished - self._previous_start)
+        self._previous_start = started
+        self._previous_values = dict(values)
+
+    def _narrow(self, start: float, width: float) -> None:
+        """Intersect the phase window with a new observation window."""
+        period = self.period
+        if period is None or width >= period:
+            return
+        start %= period
+        if self._phase_start is None:
+            self._phase_start, self._phase_width = start, width
+            return
+        # Both windows are arcs on a circle of length period.
+        offset = (start - self._phase_start) % period
+        if offset <= self._phase_width:
+            self._phase_start = start
+            self._phase_width = min(self._phase_width - offset, width)
+            return
+        offset = (self._phase_start - start) % period
+        if offset <= width:
+            self._phase_width = min(width - offset, self._phase_width)
+            return
+        # No overlap, the controller clock has drifted. Start over.
+        self._phase_start, self._phase_width = start, width
+
+    @property
+    def aligned(self) -> bool:
+        """Return True when the refresh instant is known well enough."""
+        # Two sweeps as close as allowed bound how narrow an observation can get.
+        tolerance = PHASE_TOLERANCE + self._min_delay + 2 * self._sweep_duration
+        return self._phase_start is not None and self._phase_width <= tolerance
+
+    def can_align(self, min_delay: float) -> bool:
+        """
+        Return True when the phase can be learned with reads *min_delay* apart.
+
+        Narrowing needs two sweeps closer together than one period, and a
+        period of only a few sweeps cannot be hit reliably anyway.
+        """
+        period = self.period
+        return period is not None and period > max(
+            MIN_PERIOD_SWEEPS * self._sweep_duration,
+            min_delay + self._sweep_duration,
+        )
+
+    def next_delay(self, now: float, interval: float, min_delay: float = 0) -> float:
+        """
+        Return the delay until the next read, about *interval* from *now*.
+
+        Reads land just after an expected refresh, but never sooner than
+        *min_delay*. Without a usable period *interval* is returned unchanged.
+        """
+        min_delay = max(min_delay, MIN_ALIGNED_DELAY)
+        self._min_delay = min_delay
+        if not self.can_align(min_delay):
+            return max(interval, min_delay)
+        return max(self._aligned_delay(now, interval, min_delay), min_delay)
+
+    def _aligned_delay(self, now: float, interval: float, min_delay: float) -> float:
+        """Return the delay until the next probe or aligned read."""
+        period: float = self.period  # type: ignore[assignment]
+        if self._phase_start is None:
+            # Sweeps closer than one period are needed to see the phase at all.
+            return min(interval, period / 2)
+        earliest = now + min_delay
+        if self._probe_step == 0:
+            earliest = max(earliest, now + interval - period / 2)
+            if not self.aligned:
+                self._probe_step = 1
+        elif self._probe_step < len(PROBE_POINTS):
+            self._probe_step += 1
+        else:
+            self._probe_step = 0
+            earliest = max(earliest, now + interval - period / 2)
+        point = PROBE_POINTS[self._probe_step - 1] if self._probe_step else 1.0
+        target = self._phase_start + self._phase_width * point
+        if point == 1.0:
+            target += ALIGN_MARGIN
+        cycles = math.ceil((earliest - target) / period)
+        return target + cycles * period - now
+
+    @property
+    def attributes(self) -> dict[str, Any]:
+        """Diagnostic attributes describing the learned cadence."""
+        return {
+            "device_period": self.period,
+            "phase_uncertainty": None
+            if self._phase_start is None
+            else round(self._phase_width, 1),
+        }
@@ -0,0 +1,214 @@
+"""
+Register map of the EH-800.
+
+The registers the integration reads are declared in registers.json. Every
+entry has these fields:
+
+    key           register we ask the device for, e.g. S_227_85 (required)
+    name          human readable name (required)
+    type          float, integer, enum or text (required)
+    scale         factor applied to numeric values (default 1.0)
+    unit          unit of the scaled value
+    circuit       heating circuit, L1, L2 or common (default common)
+    tier          poll tier, fast, normal or slow (default normal)
+    writable      whether the controller accepts writes (default false)
+    low_limit, high_limit
+                  registers holding the allowed range of the value, checked
+                  by the alarm channel together with the fast tier
+    icon, device_class, state_class
+                  passed on to the Home Assistant entity
+
+The file is loaded once at import into an immutable index. Other firmware
+variants or the EH-800B only need a different file, see load_register_map.
+"""
+
+from __future__ import annotations
+
+import json
+from collections import defaultdict
+from dataclasses import dataclass, fields
+from pathlib import Path
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from collections.abc import Iterable, Iterator, Mapping
+
+DEFAULT_REGISTER_MAP = Path(__file__).with_name("registers.json")
+
+TYPES = ("float", "integer", "enum", "text")
+TIERS = ("fast", "normal", "slow")
+# Value types reported as they are instead of as numbers.
+TEXT_TYPES = frozenset({"enum", "text"})
+# Keys per request, keeps the URL short for the web server of the controller.
+BATCH_SIZE = 16
+
+
+class RegisterMapError(Exception):
+    """Exception to indicate an invalid register map."""
+
+
+@dataclass(frozen=True, slots=True)
+class Register:
+    """One register of the controller."""
+
+    key: str
+    name: str
+    type: str
+    scale: float = 1.0
+    unit: str | None = None
+    circuit: str = "common"
+    tier: str = "normal"
+    writable: bool = False
+    icon: str | None = None
+    device_class: str | None = None
+    state_class: str | None = None
+    low_limit: str | None = None
+    high_limit: str | None = None
+
+    def convert(self, raw: str | None) -> float | str | None:
+        """Return the value of a raw reading, or None when it is missing."""
+        if self.type in TEXT_TYPES:
+            return raw or None
+        try:
+            number = float(raw) * self.scale  # type: ignore[arg-type]
+        except (TypeError, ValueError):
+            return None
+        if self.type == "integer" and number.is_integer():
+            return int(number)
+        return number
+
+
+_FIELDS = frozenset(field.name for field in fields(Register))
+
+
+def _register(entry: Mapping[str, Any]) -> Register:
+    """Return the register of one entry of the map, checking its schema."""
+    unknown = set(entry) - _FIELDS
+    if unknown:
+        msg = f"Unknown fields {sorted(unknown)} in register {entry.get('key')}"
+        raise RegisterMapError(msg)
+    missing = {"key", "name", "type"} - set(entry)
+    if missing:
+        msg = f"Missing fields {sorted(missing)} in register {entry.get('key')}"
+        raise RegisterMapError(msg)
+    register = Register(**entry)
+    if register.type not in TYPES:
+        msg = f"Register {register.key} has unknown type {register.type}"
+        raise RegisterMapError(msg)
+    if register.tier not in TIERS:
+        msg = f"Register {register.key} has unknown poll tier {register.tier}"
+        raise RegisterMapError(msg)
+    if not isinstance(register.scale, int | float) or register.scale == 0:
+        msg = f"Register {register.key} has invalid scale {register.scale}"
+        raise RegisterMapError(msg)
+    return register
+
+
+def build_batches(keys: Iterable[str], size: int = BATCH_SIZE) -> tuple[str, ...]:
+    """Return request strings reading *keys* in groups of at most *size*."""
+    keys = list(keys)
+    return tuple(";".join(keys[i : i + size]) for i in range(0, len(keys), size))
+
+
+def _group(
+    registers: tuple[Register, ...], attribute: str
+) -> Mapping[str, tuple[Register, ...]]:
+    """Return *registers* grouped by the value of *attribute*."""
+    groups: dict[str, list[Register]] = defaultdict(list)
+    for register in registers:
+        groups[getattr(register, attribute)].append(register)
+    return MappingProxyType({value: tuple(group) for value, group in groups.items()})
+
+
+@dataclass(frozen=True, slots=True)
+class RegisterMap:
+    """Immutable index of a register map with precomputed lookups."""
+
+    model: str
+    registers: tuple[Register, ...]
+    keys: tuple[str, ...]
+    by_key: Mapping[str, Register]
+    by_circuit: Mapping[str, tuple[Register, ...]]
+    by_tier: Mapping[str, tuple[Register, ...]]
+    by_type: Mapping[str, tuple[Register, ...]]
+    batches: tuple[str, ...]
+    tier_batches: Mapping[str, tuple[str, ...]]
+    limited: tuple[Register, ...]
+
+    @classmethod
+    def from_registers(cls, model: str, registers: Iterable[Register]) -> RegisterMap:
+        """Index *registers*."""
+        registers = tuple(registers)
+        by_key = {register.key: register for register in registers}
+        if len(by_key) != len(registers):
+            msg = f"Duplicate register keys in the register map of {model}"
+            raise RegisterMapError(msg)
+        for register in registers:
+            for limit in (register.low_limit, register.high_limit):
+                if limit is not None and limit not in by_key:
+                    msg = f"Register {register.key} has unknown limit {limit}"
+                    raise RegisterMapError(msg)
+        by_tier = _group(registers, "tier")
+        return cls(
+            model=model,
+            registers=registers,
+            keys=tuple(by_key),
+            by_key=MappingProxyType(by_key),
+            by_circuit=_group(registers, "circuit"),
+            by_tier=by_tier,
+            by_type=_group(registers, "type"),
+            batches=build_batches(by_key),
+            tier_batches=MappingProxyType(
+                {
+                    tier: build_batches(register.key for register in group)
+                    for tier, group in by_tier.items()
+                }
+            ),
+            limited=tuple(
+                register
+                for register in registers
+                if register.low_limit is not None or register.high_limit is not None
+            ),
+        )
+
+    def __contains__(self, key: object) -> bool:
+        """Return True when *key* is in the map."""
+        return key in self.by_key
+
+    def __getitem__(self, key: str) -> Register:
+        """Return the register of *key*."""
+        return self.by_key[key]
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys in file order."""
+        return iter(self.keys)
+
+    def __len__(self) -> int:
+        """Return the number of registers."""
+        return len(self.registers)
+
+    def get(self, key: str) -> Register | None:
+        """Return the register of *key* or None."""
+        return self.by_key.get(key)
+
+
+def load_register_map(path: str | Path = DEFAULT_REGISTER_MAP) -> RegisterMap:
+    """Load and index the register map in *path*. Does blocking file I/O."""
+    try:
+        data = json.loads(Path(path).read_text(encoding="utf-8"))
+        entries = data["registers"]
+        model = data.get("model", "EH-800")
+    except (OSError, ValueError, KeyError, TypeError) as exc:
+        msg = f"Unable to read the register map {path}: {exc}"
+        raise RegisterMapError(msg) from exc
+    try:
+        return RegisterMap.from_registers(
+            model, (_register(entry) for entry in entries)
+        )
+    except TypeError as exc:
+        msg = f"Invalid register map {path}: {exc}"
+        raise RegisterMapError(msg) from exc
+
+
+REGISTERS: RegisterMap = load_register_map()
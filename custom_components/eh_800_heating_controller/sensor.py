@@ -2,23 +2,32 @@
 
 from __future__ import annotations
 
-import asyncio
 import logging
-from typing import TYPE_CHECKING
-
-from homeassistant.const import Platform
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import EntityCategory, Platform, UnitOfTime
 from homeassistant.core import callback
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import CONF_IP, DEVICE_NAME, DOMAIN, SENSOR_DESCRIPTIONS
+from .const import CONF_IP, DEVICE_NAME, DOMAIN
 from .coordinator import EH800Coordinator
+from .discovery import describe_register
+from .entity import device_info as eh800_device_info
+from .registers import REGISTERS
 
 if TYPE_CHECKING:
     from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.device_registry import DeviceInfo
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .data import EH800ConfigEntry
+    from .registers import Register
 
 
 PLATFORMS: list[Platform] = [
@@ -27,6 +36,38 @@ PLATFORMS: list[Platform] = [
 _LOGGER = logging.getLogger(__name__)
 
 
+def _entity_description(register: Register) -> SensorEntityDescription:
+    """Build the entity description of a register."""
+    try:
+        device_class = SensorDeviceClass(register.device_class)
+    except ValueError:
+        device_class = None
+    return SensorEntityDescription(
+        key=register.key,
+        name=f"{DEVICE_NAME} {register.name}",
+        icon=register.icon,
+        device_class=device_class,
+        native_unit_of_measurement=register.unit,
+        state_class=None
+        if register.state_class is None
+        else SensorStateClass(register.state_class),
+    )
+
+
+ENTITY_DESCRIPTIONS: dict[str, SensorEntityDescription] = {
+    register.key: _entity_description(register) for register in REGISTERS.registers
+}
+
+POLLING_DESCRIPTION = SensorEntityDescription(
+    key="polling_interval",
+    name=f"{DEVICE_NAME} Polling Interval",
+    icon="mdi:timer-cog-outline",
+    device_class=SensorDeviceClass.DURATION,
+    native_unit_of_measurement=UnitOfTime.SECONDS,
+    entity_category=EntityCategory.DIAGNOSTIC,
+)
+
+
 async def async_setup_entry(
     hass: HomeAssistant,
     entry: EH800ConfigEntry,
@@ -38,73 +79,41 @@ async def async_setup_entry(
 
     coordinator = entry.runtime_data.coordinator
     coordinator.ip = entry.data[CONF_IP]
+    registers = entry.runtime_data.registers
+    device_info = eh800_device_info(entry)
 
-    async def add_sensor(key: str) -> None:
-        """Create a sensor entity for *key* and add it."""
-        static_entities = []
-        entity = EH800Sensor(coordinator, key)
-        static_entities.append(entity)
-        async_add_entities(static_entities)
-
-    await asyncio.gather(*(add_sensor(k) for k in coordinator.data))
+    entities: list[SensorEntity] = [
+        EH800Sensor(
+            coordinator, describe_register(key, registers.get(key, {})), device_info
+        )
+        for key in coordinator.data
+    ]
+    entities.append(EH800PollingSensor(coordinator, POLLING_DESCRIPTION, device_info))
+    async_add_entities(entities)
     return True
 
 
-class EH800Sensor(CoordinatorEntity[EH800Coordinator]):
+class EH800Sensor(CoordinatorEntity[EH800Coordinator], SensorEntity):
     """Representation of a single sensor on the EH800."""
 
-    def __init__(self, coordinator: EH800Coordinator, key: str) -> None:
+    _attr_force_update = True
+
+    def __init__(
+        self,
+        coordinator: EH800Coordinator,
+        register: Register,
+        device_info: DeviceInfo,
+    ) -> None:
         """Sensor initialization."""
         super().__init__(coordinator)
-        self.key = key
-        self._value = coordinator.data[key]
-        self._description = SENSOR_DESCRIPTIONS[key]
-        self._attr_unique_id = f"{coordinator.ip}_{key}"  # unique & never changes
-
-    @property
-    def name(self) -> str | None:
-        """The name of the sensor."""
-        return f"{DEVICE_NAME} {self._description['name']}"
-
-    @property
-    def icon(self) -> str | None:
-        """Icon of the sensor."""
-        return self._description.get("icon")
-
-    @property
-    def device_class(self) -> str | None:
-        """Device class of the sensor."""
-        return self._description.get("device_class")
-
-    @property
-    def unit_of_measurement(self) -> str | None:
-        """Device class of the sensor."""
-        return self._description.get("unit_of_measurement")
-
-    @property
-    def state_class(self) -> str | None:
-        """State class of the sensor."""
-        return self._description.get("state_class")
-
-    @property
-    def state(self) -> str:
-        """State of the EH800 sensor."""
-        return self._value
-
-    @property
-    def device_info(self) -> DeviceInfo | None:
-        """Return device information."""
-        confentry = self.coordinator.config_entry
-        if confentry:
-            return DeviceInfo(
-                identifiers={(DOMAIN, confentry.entry_id)},
-                name=DEVICE_NAME,
-                manufacturer="Jari Kaipio",
-                model=DEVICE_NAME,
-                configuration_url=f"http://{self.coordinator.ip}/",
-                entry_type=DeviceEntryType.SERVICE,
-            )
-        return None
+        self.register = register
+        self.entity_description = ENTITY_DESCRIPTIONS.get(
+            register.key
+        ) or _entity_description(register)
+        self.key = register.key
+        self._attr_unique_id = f"{coordinator.ip}_{self.key}"  # unique & never changes
+        self._attr_device_info = device_info
+        self._attr_native_value = register.convert(coordinator.data[self.key])
 
     async def async_added_to_hass(self) -> None:
         """Add the sensor to a logical EH800 device."""
@@ -123,14 +132,46 @@ class EH800Sensor(CoordinatorEntity[EH800Coordinator]):
     def _handle_coordinator_update(self) -> None:
         """Update data when the coordinator publishes a new payload."""
         # Convert the status that the coordinator sent into the entity state.
-        self._value = self.coordinator.data[self.key]
+        value = self.coordinator.data.get(self.key)
+        self._attr_native_value = self.register.convert(value)
         # Update the “available” flag if the payload for this port exists.
-        self._attr_available = self.state is not None
+        self._attr_available = value is not None
         _LOGGER.debug(
             "Sensors _handle_coordinator_update called, %s values: %s",
-            self.name,
-            self.coordinator.data[self.key],
+            self.key,
+            value,
         )
-
-        self.force_update = True
         self.async_write_ha_state()
+
+
+class EH800PollingSensor(CoordinatorEntity[EH800Coordinator], SensorEntity):
+    """Diagnostic sensor showing how often the EH800 is polled."""
+
+    # These change on every poll, keep them out of the recorder database.
+    _unrecorded_attributes = frozenset(
+        {"variances", "most_variable_keys", "changed_keys", "latency"}
+    )
+
+    def __init__(
+        self,
+        coordinator: EH800Coordinator,
+        description: SensorEntityDescription,
+        device_info: DeviceInfo,
+    ) -> None:
+        """Sensor initialization."""
+        super().__init__(coordinator)
+        self.entity_description = description
+        self._attr_unique_id = f"{coordinator.ip}_{description.key}"
+        self._attr_device_info = device_info
+
+    @property
+    def native_value(self) -> float | None:
+        """Current polling interval in seconds."""
+        if self.coordinator.update_interval is None:
+            return None
+        return self.coordinator.update_interval.total_seconds()
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Polling diagnostics from the coordinator."""
+        return self.coordinator.polling_attributes
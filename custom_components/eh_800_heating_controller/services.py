@@ -0,0 +1,124 @@
+"""Services for eh-800_heating_controller."""
+
+from __future__ import annotations
+
+import logging
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.core import ServiceCall, ServiceResponse, SupportsResponse
+from homeassistant.exceptions import ServiceValidationError
+from homeassistant.helpers import config_validation as cv
+
+from .const import DOMAIN
+from .discovery import async_scan_registers, register_range
+from .store import async_load_registers, async_save_registers
+from .trend import async_import_trend
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+    from .data import EH800ConfigEntry
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_DISCOVER_REGISTERS = "discover_registers"
+SERVICE_IMPORT_TREND = "import_trend"
+ATTR_CONFIG_ENTRY_ID = "config_entry_id"
+ATTR_START = "start"
+ATTR_END = "end"
+ATTR_SUFFIX = "suffix"
+ATTR_CONCURRENCY = "concurrency"
+ATTR_RATE = "rate"
+
+DISCOVER_REGISTERS_SCHEMA = vol.Schema(
+    {
+        vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string,
+        vol.Optional(ATTR_START, default=1): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(ATTR_END, default=400): vol.All(vol.Coerce(int), vol.Range(min=0)),
+        vol.Optional(ATTR_SUFFIX, default=85): vol.All(
+            vol.Coerce(int), vol.Range(min=0)
+        ),
+        vol.Optional(ATTR_CONCURRENCY, default=1): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=4)
+        ),
+        vol.Optional(ATTR_RATE, default=2.0): vol.All(
+            vol.Coerce(float), vol.Range(min=0.1, max=20)
+        ),
+    }
+)
+
+IMPORT_TREND_SCHEMA = vol.Schema({vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string})
+
+
+def _loaded_entries(hass: HomeAssistant, call: ServiceCall) -> list[EH800ConfigEntry]:
+    """Return the loaded entries the service call targets."""
+    entries = [
+        entry
+        for entry in hass.config_entries.async_entries(DOMAIN)
+        if entry.state is ConfigEntryState.LOADED
+        and call.data.get(ATTR_CONFIG_ENTRY_ID, entry.entry_id) == entry.entry_id
+    ]
+    if not entries:
+        msg = "No loaded EH800 config entry found"
+        raise ServiceValidationError(msg)
+    return entries
+
+
+async def _async_discover_registers(call: ServiceCall) -> ServiceResponse:
+    """Scan a register range and store the registers that answered."""
+    hass = call.hass
+    keys = register_range(
+        call.data[ATTR_START], call.data[ATTR_END], call.data[ATTR_SUFFIX]
+    )
+    response = {}
+    for entry in _loaded_entries(hass, call):
+        client = entry.runtime_data.client
+        found = await async_scan_registers(
+            client,
+            client.session,
+            keys,
+            concurrency=call.data[ATTR_CONCURRENCY],
+            rate=call.data[ATTR_RATE],
+        )
+        registers = {
+            **await async_load_registers(hass, entry.entry_id),
+            **found,
+        }
+        await async_save_registers(hass, entry.entry_id, registers)
+        entry.runtime_data.registers = registers
+        _LOGGER.info(
+            "Discovered %d registers on %s, %d known in total",
+            len(found),
+            client.ip,
+            len(registers),
+        )
+        response[entry.entry_id] = found
+    return response
+
+
+async def _async_import_trend(call: ServiceCall) -> ServiceResponse:
+    """Fill gaps in the long-term statistics from the trend log."""
+    return {
+        entry.entry_id: {"imported_hours": await async_import_trend(call.hass, entry)}
+        for entry in _loaded_entries(call.hass, call)
+    }
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the services of the integration."""
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_DISCOVER_REGISTERS,
+        _async_discover_registers,
+        schema=DISCOVER_REGISTERS_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_IMPORT_TREND,
+        _async_import_trend,
+        schema=IMPORT_TREND_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
+    )
@@ -0,0 +1,58 @@
+"""Persistent storage for eh-800_heating_controller."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.helpers.storage import Store
+
+from .const import DOMAIN
+
+if TYPE_CHECKING:
+    from homeassistant.core import HomeAssistant
+
+STORAGE_VERSION = 1
+
+
+def _registers_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding the discovered registers of an entry."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.registers")
+
+
+async def async_load_registers(
+    hass: HomeAssistant, entry_id: str
+) -> dict[str, dict[str, Any]]:
+    """Return the registers found by earlier discovery scans."""
+    data = await _registers_store(hass, entry_id).async_load()
+    return (data or {}).get("registers", {})
+
+
+async def async_save_registers(
+    hass: HomeAssistant, entry_id: str, registers: dict[str, dict[str, Any]]
+) -> None:
+    """Store the registers found by a discovery scan."""
+    await _registers_store(hass, entry_id).async_save({"registers": registers})
+
+
+def _trend_store(hass: HomeAssistant, entry_id: str) -> Store:
+    """Return the store holding how far the trend log has been imported."""
+    return Store(hass, STORAGE_VERSION, f"{DOMAIN}.{entry_id}.trend")
+
+
+async def async_load_trend_marks(hass: HomeAssistant, entry_id: str) -> dict[str, int]:
+    """Return the newest imported trend sample time of every key."""
+    data = await _trend_store(hass, entry_id).async_load()
+    return (data or {}).get("imported", {})
+
+
+async def async_save_trend_marks(
+    hass: HomeAssistant, entry_id: str, marks: dict[str, int]
+) -> None:
+    """Store the newest imported trend sample time of every key."""
+    await _trend_store(hass, entry_id).async_save({"imported": marks})
+
+
+async def async_remove_stores(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove everything stored for an entry."""
+    await _registers_store(hass, entry_id).async_remove()
+    await _trend_store(hass, entry_id).async_remove()
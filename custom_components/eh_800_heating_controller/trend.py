@@ -0,0 +1,190 @@
+"""Import the trend log of the EH800 into long-term statistics."""
+
+from __future__ import annotations
+
+import logging
+from datetime import timedelta
+from typing import TYPE_CHECKING
+
+import aiohttp
+from homeassistant.components.recorder import DOMAIN as RECORDER_DOMAIN
+from homeassistant.components.recorder import get_instance
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_import_statistics,
+    statistics_during_period,
+)
+from homeassistant.const import Platform
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+
+from .api import OumanEH800ApiClientError
+from .const import DOMAIN
+from .discovery import describe_register
+from .store import async_load_trend_marks, async_save_trend_marks
+
+if TYPE_CHECKING:
+    from collections.abc import AsyncIterator
+
+    from homeassistant.core import HomeAssistant
+
+    from .api import OumanEH800ApiClient
+    from .data import EH800ConfigEntry
+    from .registers import Register
+
+_LOGGER = logging.getLogger(__name__)
+
+# Samples requested from the controller per request.
+TREND_CHUNK = 500
+# How far back a first import reaches.
+BACKFILL_WINDOW = timedelta(days=7)
+HOUR = 3600
+
+
+def _hour_statistic(start: int, values: list[float]) -> StatisticData:
+    """Return the statistics row of one hour."""
+    return StatisticData(
+        start=dt_util.utc_from_timestamp(start),
+        mean=sum(values) / len(values),
+        min=min(values),
+        max=max(values),
+    )
+
+
+async def _async_hourly_trend(
+    client: OumanEH800ApiClient,
+    register: Register,
+    since: int,
+    until: int,
+) -> AsyncIterator[tuple[list[StatisticData], int | None]]:
+    """
+    Yield hourly statistics of *register* from after *since* until *until*.
+
+    The trend log is read in chunks of TREND_CHUNK samples and every chunk is
+    turned into the hours it completes, so only one hour is held in memory.
+    Each chunk comes with the time of the newest sample in its statistics, or
+    None when it completed no hour.
+    """
+    hour: int | None = None
+    values: list[float] = []
+    last: int | None = None
+    while True:
+        samples = sorted(
+            await client.fetch_trend(client.session, register.key, since, TREND_CHUNK)
+        )
+        done = len(samples) < TREND_CHUNK or samples[-1][0] <= since
+        stats = []
+        newest = None
+        for timestamp, value in samples:
+            if timestamp <= since:
+                continue
+            if timestamp >= until:
+                done = True
+                break
+            if timestamp - timestamp % HOUR != hour:
+                if values and hour is not None:
+                    stats.append(_hour_statistic(hour, values))
+                    newest = last
+                hour, values = timestamp - timestamp % HOUR, []
+            values.append(value * register.scale)
+            last = timestamp
+        if done:
+            if values and hour is not None:
+                stats.append(_hour_statistic(hour, values))
+                newest = last
+            yield stats, newest
+            return
+        since = samples[-1][0]
+        yield stats, newest
+
+
+async def _async_existing_hours(
+    hass: HomeAssistant, statistic_id: str, start: int, end: int
+) -> set[float]:
+    """Return the start times of the hours that already have statistics."""
+    rows = await get_instance(hass).async_add_executor_job(
+        statistics_during_period,
+        hass,
+        dt_util.utc_from_timestamp(start),
+        dt_util.utc_from_timestamp(end),
+        {statistic_id},
+        "hour",
+        None,
+        {"mean"},
+    )
+    return {row["start"] for row in rows.get(statistic_id, [])}
+
+
+async def async_import_trend(hass: HomeAssistant, entry: EH800ConfigEntry) -> int:
+    """
+    Fill gaps in the long-term statistics from the trend log of the device.
+
+    Only completed hours without statistics are imported, and the newest
+    imported sample of every key is stored so the next run continues from
+    there. Returns the number of hours imported.
+    """
+    client = entry.runtime_data.client
+    coordinator = entry.runtime_data.coordinator
+    registry = er.async_get(hass)
+    marks = await async_load_trend_marks(hass, entry.entry_id)
+    until = int(dt_util.utcnow().timestamp()) // HOUR * HOUR
+    oldest = until - int(BACKFILL_WINDOW.total_seconds())
+    imported = 0
+
+    for key in coordinator.keys:
+        register = describe_register(key, entry.runtime_data.registers.get(key, {}))
+        if register.state_class != "measurement":
+            continue
+        entity_id = registry.async_get_entity_id(
+            Platform.SENSOR, DOMAIN, f"{coordinator.ip}_{key}"
+        )
+        if entity_id is None:
+            continue
+        since = max(oldest, marks.get(key, 0))
+        if since >= until - 1:
+            continue
+        # The hour holding the mark already has statistics; query from its start
+        # so a late sample in it does not replace them with a partial hour.
+        existing = await _async_existing_hours(
+            hass, entity_id, since - since % HOUR, until
+        )
+        metadata = StatisticMetaData(
+            has_mean=True,
+            has_sum=False,
+            name=None,
+            source=RECORDER_DOMAIN,
+            statistic_id=entity_id,
+            unit_of_measurement=register.unit,
+        )
+        newest = None
+        failed = False
+        try:
+            async for stats, last in _async_hourly_trend(
+                client, register, since, until
+            ):
+                missing = [
+                    row for row in stats if row["start"].timestamp() not in existing
+                ]
+                if missing:
+                    async_import_statistics(hass, metadata, missing)
+                    imported += len(missing)
+                if last is not None:
+                    newest = last
+        except (OumanEH800ApiClientError, aiohttp.ClientError, TimeoutError) as exc:
+            _LOGGER.warning("Unable to read the trend log of %s: %s", key, exc)
+            failed = True
+        # Only what was actually parsed counts as imported, so an answer in an
+        # unexpected format does not mark the window as done.
+        if newest is not None:
+            marks[key] = newest
+        elif not failed:
+            _LOGGER.debug("No trend samples of %s since %d", key, since)
+        if failed:
+            break
+
+    await async_save_trend_marks(hass, entry.entry_id, marks)
+    _LOGGER.debug("Imported %d hours of trend data from %s", imported, client.ip)
+    return imported
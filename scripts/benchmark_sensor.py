@@ -0,0 +1,197 @@
+# ruff: noqa: INP001
+"""
+Measure the cost of a state write of the EH800 sensors.
+
+Compares the current EH800Sensor with the previous implementation, which
+looked up its name, icon, device class, unit and state class from
+the const.py table on every access and built a new DeviceInfo each time.
+The previous sensor was a plain entity, so "lookups" shows the same dict
+lookups on top of SensorEntity, which validates and converts numeric states.
+
+    PYTHONPATH=custom_components python scripts/benchmark_sensor.py
+"""
+
+from __future__ import annotations
+
+import asyncio
+import tempfile
+import timeit
+from types import SimpleNamespace
+
+from eh_800_heating_controller.const import DEVICE_NAME, DOMAIN
+from eh_800_heating_controller.registers import REGISTERS
+from eh_800_heating_controller.sensor import ENTITY_DESCRIPTIONS, EH800Sensor
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorStateClass,
+)
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+
+ROUNDS = 2000
+
+# The SENSOR_DESCRIPTIONS table of const.py, rebuilt from the register map.
+SENSOR_DESCRIPTIONS = {
+    register.key: {
+        "name": register.name,
+        "icon": register.icon,
+        "device_class": register.device_class,
+        "unit_of_measurement": register.unit,
+        "state_class": register.state_class,
+    }
+    for register in REGISTERS.registers
+}
+
+
+class LegacySensor(CoordinatorEntity):
+    """The sensor before it used entity descriptions."""
+
+    def __init__(self, coordinator: SimpleNamespace, key: str) -> None:
+        """Sensor initialization."""
+        super().__init__(coordinator)
+        self.key = key
+        self._value = coordinator.data[key]
+        self._description = SENSOR_DESCRIPTIONS[key]
+        self._attr_unique_id = f"{coordinator.ip}_{key}"
+
+    @property
+    def name(self) -> str | None:
+        """The name of the sensor."""
+        return f"{DEVICE_NAME} {self._description['name']}"
+
+    @property
+    def icon(self) -> str | None:
+        """Icon of the sensor."""
+        return self._description.get("icon")
+
+    @property
+    def device_class(self) -> str | None:
+        """Device class of the sensor."""
+        return self._description.get("device_class")
+
+    @property
+    def unit_of_measurement(self) -> str | None:
+        """Unit of the sensor."""
+        return self._description.get("unit_of_measurement")
+
+    @property
+    def state_class(self) -> str | None:
+        """State class of the sensor."""
+        return self._description.get("state_class")
+
+    @property
+    def state(self) -> str:
+        """State of the sensor."""
+        return self._value
+
+    @property
+    def device_info(self) -> DeviceInfo | None:
+        """Return device information."""
+        return DeviceInfo(
+            identifiers={(DOMAIN, self.coordinator.config_entry.entry_id)},
+            name=DEVICE_NAME,
+            manufacturer="Jari Kaipio",
+            model=DEVICE_NAME,
+            configuration_url=f"http://{self.coordinator.ip}/",
+            entry_type=DeviceEntryType.SERVICE,
+        )
+
+
+class LookupSensor(CoordinatorEntity, SensorEntity):
+    """A SensorEntity that still reads the const.py table on every access."""
+
+    def __init__(self, coordinator: SimpleNamespace, key: str) -> None:
+        """Sensor initialization."""
+        super().__init__(coordinator)
+        self.key = key
+        self._description = SENSOR_DESCRIPTIONS[key]
+        self._attr_unique_id = f"{coordinator.ip}_{key}"
+
+    @property
+    def name(self) -> str | None:
+        """The name of the sensor."""
+        return f"{DEVICE_NAME} {self._description['name']}"
+
+    @property
+    def icon(self) -> str | None:
+        """Icon of the sensor."""
+        return self._description.get("icon")
+
+    @property
+    def device_class(self) -> SensorDeviceClass | None:
+        """Device class of the sensor."""
+        return ENTITY_DESCRIPTIONS[self.key].device_class
+
+    @property
+    def native_unit_of_measurement(self) -> str | None:
+        """Unit of the sensor."""
+        return self._description.get("unit_of_measurement")
+
+    @property
+    def state_class(self) -> SensorStateClass | None:
+        """State class of the sensor."""
+        return ENTITY_DESCRIPTIONS[self.key].state_class
+
+    @property
+    def native_value(self) -> float:
+        """Value of the sensor."""
+        return float(self.coordinator.data[self.key])
+
+
+def _per_entity_us(entities: list, hass: HomeAssistant) -> tuple[float, float]:
+    """Return the cost of a state calculation and a device_info lookup in µs."""
+    for number, entity in enumerate(entities):
+        entity.hass = hass
+        entity.entity_id = f"sensor.eh800_{number}"
+
+    def calculate() -> None:
+        for entity in entities:
+            entity._async_calculate_state()  # noqa: SLF001
+
+    def device_info() -> None:
+        for entity in entities:
+            _ = entity.device_info
+
+    scale = 1e6 / (ROUNDS * len(entities))
+    return (
+        min(timeit.repeat(calculate, number=ROUNDS, repeat=5)) * scale,
+        min(timeit.repeat(device_info, number=ROUNDS, repeat=5)) * scale,
+    )
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant(config_dir)
+        coordinator = SimpleNamespace(
+            data=dict.fromkeys(SENSOR_DESCRIPTIONS, "21.5"),
+            ip="192.168.1.55",
+            config_entry=SimpleNamespace(entry_id="benchmark"),
+            last_update_success=True,
+        )
+        device = DeviceInfo(identifiers={(DOMAIN, "benchmark")})
+        results = {
+            "before": _per_entity_us(
+                [LegacySensor(coordinator, key) for key in SENSOR_DESCRIPTIONS], hass
+            ),
+            "lookups": _per_entity_us(
+                [LookupSensor(coordinator, key) for key in SENSOR_DESCRIPTIONS], hass
+            ),
+            "after": _per_entity_us(
+                [
+                    EH800Sensor(coordinator, register, device)
+                    for register in REGISTERS.registers
+                ],
+                hass,
+            ),
+        }
+        print(f"{'':8}{'state write':>14}{'device_info':>14}")  # noqa: T201
+        for label, (state, info) in results.items():
+            print(f"{label:8}{state:>11.2f} µs{info:>11.2f} µs")  # noqa: T201
+        await hass.async_stop(force=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
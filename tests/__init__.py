@@ -0,0 +1 @@
+"""Tests for eh-800_heating_controller."""
@@ -0,0 +1,49 @@
+"""Tests for the alarm channel."""
+
+from __future__ import annotations
+
+import logging
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+import aiohttp
+
+from custom_components.eh_800_heating_controller.alarm import EH800AlarmCoordinator
+from custom_components.eh_800_heating_controller.api import OumanEH800ApiClient
+
+if TYPE_CHECKING:
+    import pytest
+    from homeassistant.core import HomeAssistant
+
+
+class _RefusingSession:
+    """Session of a controller that refuses every connection."""
+
+    def __init__(self) -> None:
+        self.requests = 0
+
+    def get(self, url: str, **kwargs: Any) -> Any:  # noqa: ARG002
+        """Refuse the connection."""
+        self.requests += 1
+        raise aiohttp.ClientConnectionError
+
+
+async def test_down_controller_is_reported_once(
+    hass: HomeAssistant, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Checks against a down controller cost one request and log one error."""
+    session = _RefusingSession()
+    client = OumanEH800ApiClient("192.0.2.1", "", "", session)  # type: ignore[arg-type]
+    alarm = EH800AlarmCoordinator(
+        hass,
+        SimpleNamespace(client=client, data=None),  # type: ignore[arg-type]
+        SimpleNamespace(entry_id="abc"),  # type: ignore[arg-type]
+        interval=15,
+    )
+    for _ in range(3):
+        await alarm.async_refresh()
+    assert not alarm.last_update_success
+    assert session.requests == 3
+    assert [
+        record.levelno for record in caplog.records if record.levelno > logging.DEBUG
+    ] == [logging.ERROR]
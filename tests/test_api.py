@@ -0,0 +1,62 @@
+"""Tests for the API client."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any
+from unittest.mock import AsyncMock
+
+import aiohttp
+import pytest
+
+from custom_components.eh_800_heating_controller.api import OumanEH800ApiClient
+
+
+class _RefusingSession:
+    """Session of a controller that refuses every connection."""
+
+    def get(self, url: str, **kwargs: Any) -> Any:  # noqa: ARG002
+        """Refuse the connection."""
+        raise aiohttp.ClientConnectionError
+
+
+@pytest.fixture
+def no_sleep(monkeypatch: pytest.MonkeyPatch) -> AsyncMock:
+    """Skip the backoff between attempts."""
+    sleep = AsyncMock()
+    monkeypatch.setattr(
+        "custom_components.eh_800_heating_controller.api.asyncio.sleep", sleep
+    )
+    return sleep
+
+
+async def test_single_attempt_fails_quietly(
+    no_sleep: AsyncMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """A single read that fails logs nothing above debug and does not wait."""
+    session = _RefusingSession()
+    client = OumanEH800ApiClient("192.0.2.1", "", "", session)  # type: ignore[arg-type]
+    with caplog.at_level(logging.DEBUG):
+        assert await client.fetch_value(session, "S_227_85", attempts=1) == "ERROR"
+    assert not [record for record in caplog.records if record.levelno > logging.DEBUG]
+    no_sleep.assert_not_awaited()
+
+
+async def test_retries_are_counted(
+    no_sleep: AsyncMock, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Every retry that follows is announced, and the failure is an error."""
+    session = _RefusingSession()
+    client = OumanEH800ApiClient("192.0.2.1", "", "", session)  # type: ignore[arg-type]
+    assert await client.fetch_value(session, "S_227_85", attempts=3) == "ERROR"
+    messages = [
+        (record.levelno, record.getMessage())
+        for record in caplog.records
+        if record.levelno > logging.DEBUG
+    ]
+    assert messages == [
+        (logging.WARNING, "Connection to 192.0.2.1 refused, retry 1/2"),
+        (logging.WARNING, "Connection to 192.0.2.1 refused, retry 2/2"),
+        (logging.ERROR, "Failed to read S_227_85 after 3 attempts"),
+    ]
+    assert no_sleep.await_count == 2
@@ -0,0 +1,57 @@
+"""Tests for the traffic capture."""
+
+from __future__ import annotations
+
+import json
+import zlib
+from typing import TYPE_CHECKING
+
+from custom_components.eh_800_heating_controller.api import OumanEH800ApiClient
+from custom_components.eh_800_heating_controller.capture import (
+    CaptureWriter,
+    ReplaySession,
+    read_capture,
+)
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+HOST = "192.0.2.1"
+
+
+def test_flushes_form_one_gzip_stream(tmp_path: Path) -> None:
+    """Records flushed one at a time end up in a single gzip member."""
+    path = tmp_path / "capture.jsonl.gz"
+    writer = CaptureWriter(path)
+    for index in range(5):
+        writer.record(index, HOST, "S_227_85", 0.1, status=200, body=str(index))
+        writer.flush()
+        # Readable while the capture is still running.
+        assert len(read_capture(path)) == index + 1
+    writer.close()
+
+    decompressor = zlib.decompressobj(zlib.MAX_WBITS | 16)
+    decompressor.decompress(path.read_bytes())
+    assert decompressor.eof
+    assert not decompressor.unused_data
+    assert [record["b"] for record in read_capture(path)] == list("01234")
+
+
+async def test_trend_is_recorded_and_replayed(tmp_path: Path) -> None:
+    """Trend requests go into the capture and come back from a replay."""
+    source = tmp_path / "source.jsonl"
+    body = "1700000000,21.5;\n1700000600,22.0;\n\x00"
+    record = {"t": 0, "h": HOST, "k": "S_227_85&0&500", "d": 0.1, "s": 200, "b": body}
+    source.write_text(json.dumps(record) + "\n", encoding="utf-8")
+    expected = [(1700000000, 21.5), (1700000600, 22.0)]
+
+    path = tmp_path / "capture.jsonl.gz"
+    writer = CaptureWriter(path)
+    session = ReplaySession(source, speed=0)
+    client = OumanEH800ApiClient(HOST, "", "", session, capture=writer)  # type: ignore[arg-type]
+    assert await client.fetch_trend(session, "S_227_85", 0, 500) == expected
+    client.close_capture()
+
+    replay = ReplaySession(path, speed=0)
+    client = OumanEH800ApiClient(HOST, "", "", replay)  # type: ignore[arg-type]
+    assert await client.fetch_trend(replay, "S_227_85", 0, 500) == expected
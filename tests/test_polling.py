@@ -0,0 +1,64 @@
+"""Tests for the polling helpers."""
+
+from __future__ import annotations
+
+from custom_components.eh_800_heating_controller.polling import (
+    AdaptiveInterval,
+    PhaseTracker,
+)
+
+
+def _sweep(tracker: PhaseTracker, now: float, duration: float, period: float) -> None:
+    """Feed one sweep with changed values to *tracker*."""
+    tracker.observe({"S_227_85": str(now)}, now, now + duration, period)
+
+
+def test_short_period_keeps_interval() -> None:
+    """A period shorter than a few sweeps does not speed up polling."""
+    tracker = PhaseTracker()
+    now = 0.0
+    for _ in range(20):
+        _sweep(tracker, now, duration=3.2, period=2)
+        delay = tracker.next_delay(now + 3.2, 60, min_delay=30)
+        assert delay == 60
+        now += 3.2 + delay
+    assert not tracker.can_align(30)
+
+
+def test_delays_respect_min_delay() -> None:
+    """Probe reads never come sooner than the configured minimum."""
+    tracker = PhaseTracker()
+    now = 0.0
+    for _ in range(30):
+        _sweep(tracker, now, duration=1.0, period=120)
+        delay = tracker.next_delay(now + 1.0, 60, min_delay=30)
+        assert delay >= 30
+        now += 1.0 + delay
+
+
+def test_period_unreachable_with_min_delay() -> None:
+    """Alignment is skipped when reads cannot be closer than one period."""
+    tracker = PhaseTracker()
+    _sweep(tracker, 0.0, duration=1.0, period=20)
+    assert tracker.next_delay(1.0, 300, min_delay=30) == 300
+
+
+def test_adaptive_floor_includes_latency() -> None:
+    """The adaptive floor grows with the sweep duration."""
+    adaptive = AdaptiveInterval(min_interval=30, max_interval=600, initial_interval=60)
+    assert adaptive.floor == 30
+    adaptive.observe({"S_227_85": "1.0"}, latency=20)
+    assert adaptive.floor == 80
+
+
+def test_phase_converges_with_min_delay() -> None:
+    """The refresh instant is learned without reading faster than allowed."""
+    tracker = PhaseTracker()
+    period, phase, now = 300.0, 137.0, 0.0
+    for _ in range(60):
+        value = str((now - phase) // period)
+        tracker.observe({"S_227_85": value}, now, now + 2, period)
+        now += 2 + tracker.next_delay(now + 2, 600, min_delay=30)
+    assert tracker.aligned
+    # Reads land shortly after the refresh.
+    assert (now - phase) % period < 30 + 2 * 2 + 10
@@ -0,0 +1,100 @@
+"""Tests for the trend log import."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from types import SimpleNamespace
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder.statistics import statistics_during_period
+from homeassistant.const import Platform
+from homeassistant.helpers import entity_registry as er
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.components.recorder.common import (
+    async_wait_recording_done,
+)
+
+from custom_components.eh_800_heating_controller.const import CONF_IP, DOMAIN
+from custom_components.eh_800_heating_controller.trend import (
+    HOUR,
+    async_import_trend,
+)
+
+if TYPE_CHECKING:
+    from freezegun.api import FrozenDateTimeFactory
+    from homeassistant.components.recorder import Recorder
+    from homeassistant.core import HomeAssistant
+
+IP = "192.0.2.1"
+KEY = "S_227_85"
+NOW = datetime(2026, 1, 10, 12, 30, tzinfo=UTC)
+
+
+class _TrendClient:
+    """Client answering trend requests from a list of samples."""
+
+    def __init__(self, samples: list[tuple[int, float]]) -> None:
+        self.ip = IP
+        self.session = None
+        self.samples = samples
+
+    async def fetch_trend(
+        self,
+        session: Any,  # noqa: ARG002
+        key: str,  # noqa: ARG002
+        since: int,
+        count: int,
+    ) -> list[tuple[int, float]]:
+        """Return samples from *since* on, including one taken at *since*."""
+        return [sample for sample in self.samples if sample[0] >= since][:count]
+
+
+async def _stored_hours(hass: HomeAssistant, entity_id: str) -> list[dict[str, Any]]:
+    """Return the hourly statistics of *entity_id*."""
+    await async_wait_recording_done(hass)
+    rows = await hass.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        dt_util.utc_from_timestamp(0),
+        None,
+        {entity_id},
+        "hour",
+        None,
+        {"mean", "min", "max"},
+    )
+    return rows.get(entity_id, [])
+
+
+async def test_import_twice_keeps_hours(
+    recorder_mock: Recorder,  # noqa: ARG001
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    """A second import leaves the hours of the first one alone."""
+    freezer.move_to(NOW)
+    until = int(NOW.timestamp()) // HOUR * HOUR
+    # Three hours sampled every ten minutes, the last hour with changing values.
+    samples = [
+        (until - 3 * HOUR + minute * 60, float(minute))
+        for minute in range(0, 3 * 60, 10)
+    ]
+    entry = MockConfigEntry(domain=DOMAIN, data={CONF_IP: IP})
+    entry.add_to_hass(hass)
+    entry.runtime_data = SimpleNamespace(
+        client=_TrendClient(samples),
+        coordinator=SimpleNamespace(ip=IP, keys=[KEY]),
+        registers={},
+    )
+    entity_id = (
+        er.async_get(hass)
+        .async_get_or_create(Platform.SENSOR, DOMAIN, f"{IP}_{KEY}")
+        .entity_id
+    )
+
+    assert await async_import_trend(hass, entry) == 3
+    first = await _stored_hours(hass, entity_id)
+    assert len(first) == 3
+
+    assert await async_import_trend(hass, entry) == 0
+    assert await _stored_hours(hass, entity_id) == first